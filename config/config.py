@@ -4,23 +4,81 @@ Manages all configuration settings including URLs, timeouts, browser settings, e
 """
 
 import os
+from datetime import datetime
+from functools import lru_cache
 from pathlib import Path
 
 
+@lru_cache(maxsize=None)
+def _cached_env(key: str, default: str = None) -> str:
+    """
+    Read an environment variable once and memoize the result.
+    
+    Args:
+        key: Environment variable name
+        default: Value returned when the variable is not set
+        
+    Returns:
+        Environment variable value or default
+    """
+    return os.getenv(key, default)
+
+
 class Config:
     """Central configuration class for the framework."""
     
     # Base URL
     BASE_URL = "https://www.booking.com/index.en-gb.html"
+    SEARCH_RESULTS_URL = "https://www.booking.com/searchresults.en-gb.html"
     
     # Browser settings
-    BROWSER = os.getenv("BROWSER", "chrome").lower()  # chrome, firefox, edge
-    HEADLESS = os.getenv("HEADLESS", "false").lower() == "true"
+    BROWSER = _cached_env("BROWSER", "chrome").lower()  # chrome, firefox, edge
+    HEADLESS = _cached_env("HEADLESS", "false").lower() == "true"
+    
+    # "eager" returns from navigation at DOMContentLoaded; "normal" waits for the load event
+    PAGE_LOAD_STRATEGY = _cached_env("PAGE_LOAD_STRATEGY", "eager").lower()
+    
+    # Block images, fonts and trackers through CDP Network.setBlockedURLs (Chromium only)
+    BLOCK_RESOURCES = _cached_env("BLOCK_RESOURCES", "false").lower() == "true"
+    BLOCKED_URL_PATTERNS = (
+        "*.jpg",
+        "*.jpeg",
+        "*.png",
+        "*.gif",
+        "*.webp",
+        "*.woff",
+        "*.woff2",
+        "*googletagmanager*",
+        "*doubleclick*",
+    )
+    
+    # Evaluate read-only page scripts through CDP Runtime.evaluate (Chromium only)
+    USE_CDP = _cached_env("USE_CDP", "false").lower() == "true"
+    
+    # Read result names/prices from a plain HTTP fetch of the results URL instead of the rendered page
+    FAST_SCRAPE = _cached_env("FAST_SCRAPE", "false").lower() == "true"
+    
+    # Selenium Grid / standalone server shared by parallel workers (local drivers if unset)
+    REMOTE_URL = _cached_env("SELENIUM_REMOTE_URL")
+    
+    # Opt-in: reuse a per-worker Chrome profile (and its disk cache) across runs of one checkout
+    PERSISTENT_PROFILE = _cached_env("PERSISTENT_PROFILE", "false").lower() == "true"
+    DISK_CACHE_SIZE = 256 * 1024 * 1024  # bytes
+    
+    # pytest-xdist worker running this process (empty when not running under xdist)
+    WORKER_ID = _cached_env("PYTEST_XDIST_WORKER", "")
     
     # Timeout settings (in seconds)
-    IMPLICIT_WAIT = 10
+    IMPLICIT_WAIT = 0  # Keep at 0: implicit waits add up with the explicit waits used everywhere
     EXPLICIT_WAIT = 20
     PAGE_LOAD_TIMEOUT = 30
+    SCRIPT_TIMEOUT = 35  # Async scripts; kept above PAGE_LOAD_TIMEOUT so their own JS timers fire first
+    POLL_FREQUENCY = 0.1
+    LOAD_POLL_FREQUENCY = 0.2
+    DOM_QUIET_MS = 500  # milliseconds without DOM mutations before a page counts as settled
+    NETWORK_QUIET_MS = 300  # milliseconds without finished requests before the network counts as idle
+    DOM_QUIET_TIMEOUT = 5
+    LOADED_STATE_TTL = 30  # seconds a successful page load check is reused
     
     # Window settings
     WINDOW_WIDTH = 1920
@@ -32,12 +90,14 @@ class Config:
     REPORTS_DIR = PROJECT_ROOT / "reports"
     LOGS_DIR = PROJECT_ROOT / "logs"
     SCREENSHOTS_DIR = PROJECT_ROOT / "screenshots"
+    PROFILE_ROOT = PROJECT_ROOT / ".browser_profiles"  # Per checkout, so other checkouts/users never share it
     TEST_DATA_FILE = PROJECT_ROOT / "config" / "test_data.json"
     
-    # Ensure directories exist
-    REPORTS_DIR.mkdir(exist_ok=True)
-    LOGS_DIR.mkdir(exist_ok=True)
-    SCREENSHOTS_DIR.mkdir(exist_ok=True)
+    # Directories already created by ensure_dir
+    _created_dirs = set()
+    
+    # Maximum number of idle drivers kept per (browser, headless) pair
+    DRIVER_POOL_SIZE = 2
     
     # Screenshot settings
     SCREENSHOT_ON_FAILURE = True
@@ -47,12 +107,15 @@ class Config:
     RETRY_DELAY = 1  # seconds
     
     # Logging settings
-    LOG_LEVEL = os.getenv("LOG_LEVEL", "INFO")
-    LOG_FORMAT = "%(asctime)s - %(name)s - %(levelname)s - %(message)s"
+    LOG_LEVEL = _cached_env("LOG_LEVEL", "INFO")
+    LOG_FORMAT = f"%(asctime)s - {WORKER_ID or 'main'} - %(name)s - %(levelname)s - %(message)s"
     LOG_DATE_FORMAT = "%Y-%m-%d %H:%M:%S"
     
+    # Record Allure steps and attachments when a report is written; false skips them for speed
+    ALLURE_STEPS = _cached_env("ALLURE_STEPS", "true").lower() == "true"
+    
     # Browser options
-    CHROME_OPTIONS = [
+    CHROME_OPTIONS = (
         "--disable-notifications",
         "--disable-popup-blocking",
         "--disable-infobars",
@@ -60,16 +123,54 @@ class Config:
         "--disable-gpu",
         "--no-sandbox",
         "--disable-dev-shm-usage",
-    ]
+    )
     
-    FIREFOX_OPTIONS = [
+    FIREFOX_OPTIONS = (
         "--disable-notifications",
-    ]
+    )
     
-    EDGE_OPTIONS = [
+    EDGE_OPTIONS = (
         "--disable-notifications",
         "--disable-popup-blocking",
-    ]
+    )
+    
+    # Read-only option lookup by browser name
+    _BROWSER_OPTIONS = {
+        "chrome": CHROME_OPTIONS,
+        "firefox": FIREFOX_OPTIONS,
+        "edge": EDGE_OPTIONS,
+    }
+    
+    @classmethod
+    def reload_env(cls):
+        """Drop cached environment values and re-read env-backed settings."""
+        _cached_env.cache_clear()
+        cls.BROWSER = _cached_env("BROWSER", "chrome").lower()
+        cls.HEADLESS = _cached_env("HEADLESS", "false").lower() == "true"
+        cls.REMOTE_URL = _cached_env("SELENIUM_REMOTE_URL")
+        cls.USE_CDP = _cached_env("USE_CDP", "false").lower() == "true"
+        cls.FAST_SCRAPE = _cached_env("FAST_SCRAPE", "false").lower() == "true"
+        cls.PAGE_LOAD_STRATEGY = _cached_env("PAGE_LOAD_STRATEGY", "eager").lower()
+        cls.BLOCK_RESOURCES = _cached_env("BLOCK_RESOURCES", "false").lower() == "true"
+        cls.PERSISTENT_PROFILE = _cached_env("PERSISTENT_PROFILE", "false").lower() == "true"
+        cls.LOG_LEVEL = _cached_env("LOG_LEVEL", "INFO")
+        cls.ALLURE_STEPS = _cached_env("ALLURE_STEPS", "true").lower() == "true"
+    
+    @classmethod
+    def ensure_dir(cls, directory: Path) -> Path:
+        """
+        Create a directory on first use.
+        
+        Args:
+            directory: Directory path
+            
+        Returns:
+            The same directory path
+        """
+        if directory not in cls._created_dirs:
+            directory.mkdir(parents=True, exist_ok=True)
+            cls._created_dirs.add(directory)
+        return directory
     
     @classmethod
     def get_browser_options(cls, browser: str = None) -> list:
@@ -82,16 +183,34 @@ class Config:
         Returns:
             List of browser options
         """
-        browser = browser or cls.BROWSER
+        return list(cls.get_browser_options_view(browser))
+    
+    @classmethod
+    def get_browser_options_view(cls, browser: str = None) -> tuple:
+        """
+        Get browser-specific options without copying them.
+        
+        Args:
+            browser: Browser name (chrome, firefox, edge)
+            
+        Returns:
+            Tuple of browser options
+        """
+        return cls._BROWSER_OPTIONS.get(browser or cls.BROWSER, ())
+    
+    @classmethod
+    def get_profile_dir(cls, index: int = 0) -> Path:
+        """
+        Get the persistent browser profile directory for this pytest worker.
         
-        if browser == "chrome":
-            return cls.CHROME_OPTIONS.copy()
-        elif browser == "firefox":
-            return cls.FIREFOX_OPTIONS.copy()
-        elif browser == "edge":
-            return cls.EDGE_OPTIONS.copy()
-        else:
-            return []
+        Args:
+            index: Profile number within the worker (Chrome locks a profile per instance)
+            
+        Returns:
+            Path object for the profile directory
+        """
+        suffix = f"_{index}" if index else ""
+        return cls.PROFILE_ROOT / f"bk_profile_{cls.WORKER_ID or 'main'}{suffix}"
     
     @classmethod
     def get_screenshot_path(cls, test_name: str) -> Path:
@@ -104,10 +223,9 @@ class Config:
         Returns:
             Path object for screenshot
         """
-        from datetime import datetime
         timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
         filename = f"{test_name}_{timestamp}.png"
-        return cls.SCREENSHOTS_DIR / filename
+        return cls.ensure_dir(cls.SCREENSHOTS_DIR) / filename
     
     @classmethod
     def get_log_path(cls, log_name: str = "automation") -> Path:
@@ -120,7 +238,8 @@ class Config:
         Returns:
             Path object for log file
         """
-        from datetime import datetime
         timestamp = datetime.now().strftime("%Y%m%d")
-        filename = f"{log_name}_{timestamp}.log"
-        return cls.LOGS_DIR / filename
+        # One file per xdist worker so rotation and writes never interleave
+        worker = f"_{cls.WORKER_ID}" if cls.WORKER_ID else ""
+        filename = f"{log_name}{worker}_{timestamp}.log"
+        return cls.ensure_dir(cls.LOGS_DIR) / filename
@@ -3,6 +3,7 @@ Base Page module.
 Contains the BasePage class with common methods for all page objects.
 """
 
+import json
 from selenium.webdriver.support.ui import WebDriverWait
 from selenium.webdriver.support import expected_conditions as EC
 from selenium.webdriver.common.by import By
@@ -12,19 +13,142 @@ from selenium.common.exceptions import (
     TimeoutException,
     NoSuchElementException,
     ElementClickInterceptedException,
-    StaleElementReferenceException
+    ScriptTimeoutException,
+    StaleElementReferenceException,
+    WebDriverException
 )
 from config.config import Config
 from utils.logger import get_logger
 from utils.decorators import log_action, retry
-import allure
+from utils.driver_factory import DriverFactory
+from utils.helpers import FileHelper, ReportHelper
 
 logger = get_logger(__name__)
 
+# Lookup failures that page getters turn into sentinel values; anything else propagates
+LOOKUP_ERRORS = (TimeoutException, NoSuchElementException, StaleElementReferenceException)
+
+# Returns the first element matching any of the CSS selectors passed as arguments
+FIRST_MATCH_SCRIPT = (
+    "for (var i = 0; i < arguments.length; i++) {"
+    "  var el = document.querySelector(arguments[i]);"
+    "  if (el) { return el; }"
+    "}"
+    "return null;"
+)
+
+# Returns index, innerText and aria-label of the first element matching any of
+# the CSS selectors in arguments[0], or null
+QUERY_FIRST_SCRIPT = (
+    "var selectors = arguments[0];"
+    "for (var i = 0; i < selectors.length; i++) {"
+    "  var el = document.querySelector(selectors[i]);"
+    "  if (el) { return {index: i, text: el.innerText, aria: el.getAttribute('aria-label')}; }"
+    "}"
+    "return null;"
+)
+
+# Reads several values in one call. arguments[0] maps keys to CSS selector lists
+# (first match as {index, text, aria}, or null); arguments[1] maps keys to a CSS
+# selector (non-empty, trimmed innerText of every match)
+SNAPSHOT_SCRIPT = (
+    "var firsts = arguments[0], alls = arguments[1], result = {};"
+    "for (var key in firsts) {"
+    "  result[key] = null;"
+    "  for (var i = 0; i < firsts[key].length; i++) {"
+    "    var el = document.querySelector(firsts[key][i]);"
+    "    if (el) { result[key] = {index: i, text: el.innerText, aria: el.getAttribute('aria-label')}; break; }"
+    "  }"
+    "}"
+    "for (var key in alls) {"
+    "  result[key] = Array.from(document.querySelectorAll(alls[key]))"
+    "    .map(function(e) { return e.innerText.trim(); }).filter(Boolean);"
+    "}"
+    "return result;"
+)
+
+# Maps each key of arguments[0] to whether any of its CSS selectors matches,
+# plus "ready" once the DOM has been parsed
+PROBE_PRESENCE_SCRIPT = (
+    "var groups = arguments[0], result = {ready: document.readyState !== 'loading'};"
+    "for (var key in groups) {"
+    "  result[key] = groups[key].some(function(s) { return !!document.querySelector(s); });"
+    "}"
+    "return result;"
+)
+
+# True once the DOM has been parsed and any CSS selector in arguments matches
+READY_WITH_ANY_SCRIPT = (
+    "if (document.readyState === 'loading') { return false; }"
+    "for (var i = 0; i < arguments.length; i++) {"
+    "  if (document.querySelector(arguments[i])) { return true; }"
+    "}"
+    "return false;"
+)
+
+# Returns the non-empty, trimmed innerText of the elements matching the CSS selector
+# arguments[0], stopping after arguments[1] texts when given
+ALL_TEXTS_SCRIPT = (
+    "var els = document.querySelectorAll(arguments[0]), limit = arguments[1] || els.length, texts = [];"
+    "for (var i = 0; i < els.length && texts.length < limit; i++) {"
+    "  var text = els[i].innerText.trim();"
+    "  if (text) { texts.push(text); }"
+    "}"
+    "return texts;"
+)
+
+# Resolves true on the window load event, or on DOMContentLoaded when
+# arguments[1] is true (immediately if already reached), false after
+# arguments[0] milliseconds
+LOAD_EVENT_SCRIPT = (
+    "var done = arguments[arguments.length - 1];"
+    "var eager = arguments[1];"
+    "if (document.readyState === 'complete' || (eager && document.readyState === 'interactive')) {"
+    "  done(true); return;"
+    "}"
+    "var timer = setTimeout(function() { done(false); }, arguments[0]);"
+    "window.addEventListener(eager ? 'DOMContentLoaded' : 'load', function() { clearTimeout(timer); done(true); });"
+)
+
+# Resolves true once no nodes have been added or removed for arguments[0] milliseconds,
+# false if it is still changing after arguments[1] milliseconds. Attribute changes are
+# ignored: carousels, lazy images and tracking attributes update them constantly.
+DOM_QUIET_SCRIPT = (
+    "var done = arguments[arguments.length - 1];"
+    "var quiet = arguments[0];"
+    "var finish = function(result) { observer.disconnect(); clearTimeout(timer); clearTimeout(cap); done(result); };"
+    "var observer = new MutationObserver(function() {"
+    "  clearTimeout(timer); timer = setTimeout(function() { finish(true); }, quiet);"
+    "});"
+    "var timer = setTimeout(function() { finish(true); }, quiet);"
+    "var cap = setTimeout(function() { finish(false); }, arguments[1]);"
+    "observer.observe(document.body || document.documentElement,"
+    " {subtree: true, childList: true});"
+)
+
+# Resolves true once no new resource has finished loading for arguments[0]
+# milliseconds, false if the browser is offline or requests are still landing
+# after arguments[1] milliseconds. Uses a PerformanceObserver so a full
+# resource timing buffer cannot fake quiescence.
+NETWORK_QUIET_SCRIPT = (
+    "var done = arguments[arguments.length - 1];"
+    "if (!navigator.onLine) { done(false); return; }"
+    "var quiet = arguments[0];"
+    "var finish = function(result) { observer.disconnect(); clearTimeout(timer); clearTimeout(cap); done(result); };"
+    "var observer = new PerformanceObserver(function() {"
+    "  clearTimeout(timer); timer = setTimeout(function() { finish(true); }, quiet);"
+    "});"
+    "var timer = setTimeout(function() { finish(true); }, quiet);"
+    "var cap = setTimeout(function() { finish(false); }, arguments[1]);"
+    "observer.observe({entryTypes: ['resource']});"
+)
+
 
 class BasePage:
     """Base page class with common methods for all page objects."""
     
+    __slots__ = ("driver", "wait", "_wait_pool", "_actions", "_selector_cache")
+    
     def __init__(self, driver):
         """
         Initialize BasePage.
@@ -34,7 +158,77 @@ class BasePage:
         """
         self.driver = driver
         self.wait = WebDriverWait(driver, Config.EXPLICIT_WAIT)
-        self.actions = ActionChains(driver)
+        self._wait_pool = {(Config.EXPLICIT_WAIT, None): self.wait}
+        self._actions = None
+        # locator -> WebElement resolved on the current page; cleared on navigation and clicks
+        self._selector_cache = {}
+    
+    @property
+    def actions(self) -> ActionChains:
+        """ActionChains for the driver, created on first use."""
+        if self._actions is None:
+            self._actions = ActionChains(self.driver)
+        return self._actions
+    
+    def _get_wait(self, timeout: int = None, poll_frequency: float = None) -> WebDriverWait:
+        """
+        Get a reusable WebDriverWait for the given timeout.
+        
+        Args:
+            timeout: Wait timeout (uses Config.EXPLICIT_WAIT if not provided)
+            poll_frequency: Poll interval (uses the WebDriverWait default if not provided)
+            
+        Returns:
+            WebDriverWait instance
+        """
+        timeout = timeout or Config.EXPLICIT_WAIT
+        key = (timeout, poll_frequency)
+        wait = self._wait_pool.get(key)
+        if wait is None:
+            if poll_frequency is None:
+                wait = WebDriverWait(self.driver, timeout)
+            else:
+                wait = WebDriverWait(self.driver, timeout, poll_frequency=poll_frequency)
+            self._wait_pool[key] = wait
+        return wait
+    
+    def _find_cached(self, locator: tuple, timeout: int = None):
+        """
+        Get an element from the selector cache, resolving it on a miss.
+        
+        Args:
+            locator: Tuple of (By, value)
+            timeout: Custom timeout used on a cache miss
+            
+        Returns:
+            WebElement
+        """
+        element = self._selector_cache.get(locator)
+        if element is None:
+            element = self._selector_cache[locator] = self.find_element(locator, timeout)
+        return element
+    
+    def _with_cached_element(self, locator: tuple, action, timeout: int = None):
+        """
+        Run an action on a cached element, re-resolving it once if it went stale.
+        
+        Args:
+            locator: Tuple of (By, value)
+            action: Callable receiving the WebElement
+            timeout: Custom timeout used on a cache miss
+            
+        Returns:
+            Result of the action
+        """
+        try:
+            return action(self._find_cached(locator, timeout))
+        except StaleElementReferenceException:
+            self._selector_cache.pop(locator, None)
+            return action(self._find_cached(locator, timeout))
+    
+    def invalidate_selector_cache(self):
+        """Forget all cached elements (after navigation or DOM-changing actions)."""
+        self._selector_cache.clear()
     
     @log_action
     def open_url(self, url: str):
@@ -45,10 +239,21 @@ class BasePage:
             url: URL to open
         """
         logger.info(f"Opening URL: {url}")
+        self.invalidate_selector_cache()
         self.driver.get(url)
-        allure.attach(url, name="URL", attachment_type=allure.attachment_type.TEXT)
+        self.attach("URL", url)
+    
+    def attach(self, name: str, value):
+        """
+        Attach a value to the report (batched into one attachment per test).
+        
+        Args:
+            name: Attachment name
+            value: Attachment value
+        """
+        ReportHelper.attach(name, value)
     
-    @retry(max_attempts=3, delay=1.0, exceptions=(StaleElementReferenceException,))
+    @retry(max_attempts=3, delay=0.05, exceptions=(StaleElementReferenceException,), backoff=4.0)
     def find_element(self, locator: tuple, timeout: int = None):
         """
         Find an element with explicit wait.
@@ -60,17 +265,17 @@ class BasePage:
         Returns:
             WebElement
         """
-        timeout = timeout or Config.EXPLICIT_WAIT
         try:
-            element = WebDriverWait(self.driver, timeout).until(
+            element = self._get_wait(timeout, Config.POLL_FREQUENCY).until(
                 EC.presence_of_element_located(locator)
             )
+            self._selector_cache[locator] = element
             return element
         except TimeoutException:
             logger.error(f"Element not found: {locator}")
             raise
     
-    @retry(max_attempts=3, delay=1.0, exceptions=(StaleElementReferenceException,))
+    @retry(max_attempts=3, delay=0.05, exceptions=(StaleElementReferenceException,), backoff=4.0)
     def find_elements(self, locator: tuple, timeout: int = None):
         """
         Find multiple elements.
@@ -82,9 +287,8 @@ class BasePage:
         Returns:
             List of WebElements
         """
-        timeout = timeout or Config.EXPLICIT_WAIT
         try:
-            elements = WebDriverWait(self.driver, timeout).until(
+            elements = self._get_wait(timeout, Config.POLL_FREQUENCY).until(
                 EC.presence_of_all_elements_located(locator)
             )
             return elements
@@ -92,6 +296,105 @@ class BasePage:
             logger.warning(f"Elements not found: {locator}")
             return []
     
+    def find_first_element(self, *locators: tuple, timeout: int = None):
+        """
+        Find the first element matching any of several CSS locators.
+        
+        All locators are probed in a single script call per poll.
+        
+        Args:
+            *locators: Tuples of (By.CSS_SELECTOR, value) in priority order
+            timeout: Custom timeout
+            
+        Returns:
+            WebElement
+        """
+        selectors = [value for _, value in locators]
+        try:
+            return self._get_wait(timeout).until(
+                lambda driver: driver.execute_script(FIRST_MATCH_SCRIPT, *selectors)
+            )
+        except TimeoutException:
+            logger.error(f"None of the elements found: {locators}")
+            raise
+    
+    def _run_script(self, script: str, *args):
+        """
+        Run a script that only reads the page and returns a JSON-serializable value.
+        
+        Uses CDP Runtime.evaluate on Chromium drivers when Config.USE_CDP is set,
+        otherwise execute_script. Scripts must not return or receive WebElements.
+        
+        Args:
+            script: JavaScript function body using ``arguments``
+            *args: JSON-serializable arguments
+            
+        Returns:
+            Script result
+        """
+        if Config.USE_CDP and hasattr(self.driver, "execute_cdp_cmd"):
+            expression = f"(function() {{ {script} }}).apply(null, {json.dumps(args)})"
+            response = self.driver.execute_cdp_cmd(
+                "Runtime.evaluate", {"expression": expression, "returnByValue": True}
+            )
+            if "exceptionDetails" in response:
+                raise WebDriverException(f"Script failed: {response['exceptionDetails'].get('text')}")
+            return response["result"].get("value")
+        return self.driver.execute_script(script, *args)
+    
+    def _query_first(self, locators: list, timeout: int = 0) -> dict:
+        """
+        Read text and aria-label of the first element matching any CSS locator.
+        
+        All locators are checked in one script call per poll.
+        
+        Args:
+            locators: Tuples of (By.CSS_SELECTOR, value) in priority order
+            timeout: How long to keep polling for a match (0 checks once)
+            
+        Returns:
+            Dict with index, text and aria keys, or None if nothing matched
+        """
+        selectors = [value for _, value in locators]
+        if not timeout:
+            return self._run_script(QUERY_FIRST_SCRIPT, selectors)
+        try:
+            return self._get_wait(timeout).until(
+                lambda driver: self._run_script(QUERY_FIRST_SCRIPT, selectors)
+            )
+        except TimeoutException:
+            return None
+    
+    def _probe_presence(self, groups: dict) -> dict:
+        """
+        Check presence of several groups of alternative CSS locators in one script call.
+        
+        Args:
+            groups: Mapping of name to list of (By.CSS_SELECTOR, value) tuples
+            
+        Returns:
+            Mapping of name to True if any locator of the group matched, plus
+            "ready" for whether the DOM has been parsed
+        """
+        selectors = {key: [value for _, value in locators] for key, locators in groups.items()}
+        return self._run_script(PROBE_PRESENCE_SCRIPT, selectors)
+    
+    def _read_snapshot(self, firsts: dict, alls: dict = None) -> dict:
+        """
+        Read first-match details and text lists for several CSS locators in one script call.
+        
+        Args:
+            firsts: Mapping of name to list of (By.CSS_SELECTOR, value) tuples in priority order
+            alls: Mapping of name to a (By.CSS_SELECTOR, value) tuple whose matches are all read
+            
+        Returns:
+            Mapping of each name in firsts to a dict with index, text and aria keys
+            (or None), and of each name in alls to a list of texts
+        """
+        first_selectors = {key: [value for _, value in locators] for key, locators in firsts.items()}
+        all_selectors = {key: locator[1] for key, locator in (alls or {}).items()}
+        return self._run_script(SNAPSHOT_SCRIPT, first_selectors, all_selectors)
+    
     @log_action
     def click(self, locator: tuple, timeout: int = None):
         """
@@ -101,13 +404,36 @@ class BasePage:
             locator: Tuple of (By, value)
             timeout: Custom timeout
         """
+        self.click_element(self.wait_for_clickable(locator, timeout))
+        logger.info(f"Clicked element: {locator}")
+    
+    def click_element(self, element):
+        """
+        Click an already located element, falling back to a JavaScript click.
+        
+        Args:
+            element: WebElement to click
+        """
+        self.invalidate_selector_cache()
         try:
-            element = self.wait_for_clickable(locator, timeout)
             element.click()
-            logger.info(f"Clicked element: {locator}")
         except ElementClickInterceptedException:
-            logger.warning(f"Click intercepted, trying JavaScript click: {locator}")
-            self.click_with_js(locator)
+            logger.warning("Click intercepted, trying JavaScript click")
+            self.click_element_with_js(element)
+    
+    @log_action
+    def click_any(self, *locators: tuple, timeout: int = None):
+        """
+        Click the first of several alternative elements that becomes clickable.
+        
+        Args:
+            *locators: Tuples of (By, value) for the alternatives
+            timeout: Custom timeout shared by all alternatives
+        """
+        element = self._get_wait(timeout).until(
+            EC.any_of(*(EC.element_to_be_clickable(locator) for locator in locators))
+        )
+        self.click_element(element)
     
     @log_action
     def click_with_js(self, locator: tuple):
@@ -117,10 +443,19 @@ class BasePage:
         Args:
             locator: Tuple of (By, value)
         """
-        element = self.find_element(locator)
-        self.driver.execute_script("arguments[0].click();", element)
+        self._with_cached_element(locator, self.click_element_with_js)
         logger.info(f"Clicked element with JS: {locator}")
     
+    def click_element_with_js(self, element):
+        """
+        Click an already located element using JavaScript.
+        
+        Args:
+            element: WebElement to click
+        """
+        self.invalidate_selector_cache()
+        self.driver.execute_script("arguments[0].click();", element)
+    
     @log_action
     def type_text(self, locator: tuple, text: str, clear_first: bool = True):
         """
@@ -131,11 +466,23 @@ class BasePage:
             text: Text to type
             clear_first: Clear field before typing
         """
-        element = self.find_element(locator)
+        self._with_cached_element(
+            locator, lambda element: self.type_into_element(element, text, clear_first)
+        )
+        logger.info(f"Typed '{text}' into element: {locator}")
+    
+    def type_into_element(self, element, text: str, clear_first: bool = True):
+        """
+        Type text into an already located element.
+        
+        Args:
+            element: WebElement to type into
+            text: Text to type
+            clear_first: Clear field before typing
+        """
         if clear_first:
             element.clear()
         element.send_keys(text)
-        logger.info(f"Typed '{text}' into element: {locator}")
     
     def get_text(self, locator: tuple, timeout: int = None) -> str:
         """
@@ -148,11 +495,60 @@ class BasePage:
         Returns:
             Element text
         """
-        element = self.find_element(locator, timeout)
-        text = element.text
+        text = self._with_cached_element(locator, self.get_element_text, timeout)
         logger.info(f"Got text '{text}' from element: {locator}")
         return text
     
+    def get_element_text(self, element) -> str:
+        """
+        Get text from an already located element.
+        
+        Args:
+            element: WebElement
+            
+        Returns:
+            Element text
+        """
+        return element.text
+    
+    def get_all_texts(self, locator: tuple, limit: int = None) -> list:
+        """
+        Get the non-empty texts of all elements matching a CSS locator in one call.
+        
+        Args:
+            locator: Tuple of (By.CSS_SELECTOR, value)
+            limit: Maximum number of texts to read (all if not provided)
+            
+        Returns:
+            List of element texts
+        """
+        return self._run_script(ALL_TEXTS_SCRIPT, locator[1], limit)
+    
+    def get_all_texts_stable(self, locator: tuple, timeout: int = 5) -> list:
+        """
+        Get all texts of a CSS locator once the number of matches stops changing.
+        
+        Polls get_all_texts until two consecutive reads return the same non-zero count.
+        
+        Args:
+            locator: Tuple of (By.CSS_SELECTOR, value)
+            timeout: Custom timeout
+            
+        Returns:
+            List of element texts (the last read if the count never settled)
+        """
+        last = []
+        
+        def settled(driver):
+            nonlocal last
+            previous, last = last, self.get_all_texts(locator)
+            return last if last and len(last) == len(previous) else False
+        
+        try:
+            return self._get_wait(timeout, Config.LOAD_POLL_FREQUENCY).until(settled)
+        except TimeoutException:
+            return last
+    
     def get_attribute(self, locator: tuple, attribute: str) -> str:
         """
         Get attribute value from an element.
@@ -164,9 +560,9 @@ class BasePage:
         Returns:
             Attribute value
         """
-        element = self.find_element(locator)
-        value = element.get_attribute(attribute)
-        return value
+        return self._with_cached_element(
+            locator, lambda element: element.get_attribute(attribute)
+        )
     
     def is_element_visible(self, locator: tuple, timeout: int = 5) -> bool:
         """
@@ -180,13 +576,54 @@ class BasePage:
             True if visible, False otherwise
         """
         try:
-            WebDriverWait(self.driver, timeout).until(
+            self._selector_cache[locator] = self._get_wait(timeout).until(
                 EC.visibility_of_element_located(locator)
             )
             return True
         except TimeoutException:
             return False
     
+    def is_any_element_visible(self, *locators: tuple, timeout: int = 5) -> bool:
+        """
+        Check if any of several alternative elements is visible.
+        
+        Args:
+            *locators: Tuples of (By, value) for the alternatives
+            timeout: Custom timeout shared by all alternatives
+            
+        Returns:
+            True if one of them is visible, False otherwise
+        """
+        try:
+            self._get_wait(timeout).until(
+                EC.any_of(*(EC.visibility_of_element_located(locator) for locator in locators))
+            )
+            return True
+        except TimeoutException:
+            return False
+    
+    def is_ready_with_any(self, *locators: tuple, timeout: int = 15) -> bool:
+        """
+        Check that the document is loaded and any of several CSS locators is present.
+        
+        Readiness and all locators are checked in one script call per poll.
+        
+        Args:
+            *locators: Tuples of (By.CSS_SELECTOR, value) for the alternatives
+            timeout: Custom timeout
+            
+        Returns:
+            True if loaded and present, False otherwise
+        """
+        selectors = [value for _, value in locators]
+        try:
+            self._get_wait(timeout, Config.LOAD_POLL_FREQUENCY).until(
+                lambda driver: self._run_script(READY_WITH_ANY_SCRIPT, *selectors)
+            )
+            return True
+        except TimeoutException:
+            return False
+    
     def is_element_present(self, locator: tuple, timeout: int = 5) -> bool:
         """
         Check if element is present in DOM.
@@ -199,7 +636,7 @@ class BasePage:
             True if present, False otherwise
         """
         try:
-            WebDriverWait(self.driver, timeout).until(
+            self._selector_cache[locator] = self._get_wait(timeout).until(
                 EC.presence_of_element_located(locator)
             )
             return True
@@ -217,8 +654,7 @@ class BasePage:
         Returns:
             WebElement
         """
-        timeout = timeout or Config.EXPLICIT_WAIT
-        element = WebDriverWait(self.driver, timeout).until(
+        element = self._get_wait(timeout).until(
             EC.element_to_be_clickable(locator)
         )
         return element
@@ -234,15 +670,65 @@ class BasePage:
         Returns:
             True if invisible, False otherwise
         """
-        timeout = timeout or Config.EXPLICIT_WAIT
         try:
-            WebDriverWait(self.driver, timeout).until(
+            self._get_wait(timeout).until(
                 EC.invisibility_of_element_located(locator)
             )
             return True
         except TimeoutException:
             return False
     
+    def wait_for_url_contains(self, fragment: str, timeout: int = None) -> bool:
+        """
+        Wait for the current URL to contain a fragment.
+        
+        Args:
+            fragment: Expected URL fragment
+            timeout: Custom timeout
+            
+        Returns:
+            True if URL matched, False otherwise
+        """
+        try:
+            self._get_wait(timeout).until(EC.url_contains(fragment))
+            return True
+        except TimeoutException:
+            return False
+    
+    def wait_for_staleness(self, element, timeout: int = None) -> bool:
+        """
+        Wait for an element to be detached from the DOM (e.g. after a re-render).
+        
+        Args:
+            element: WebElement expected to go stale
+            timeout: Custom timeout
+            
+        Returns:
+            True if element went stale, False otherwise
+        """
+        try:
+            self._get_wait(timeout).until(EC.staleness_of(element))
+            return True
+        except TimeoutException:
+            return False
+    
+    def wait_for_new_window(self, known_handles: list, timeout: int = None) -> bool:
+        """
+        Wait for a window/tab that is not in known_handles to open.
+        
+        Args:
+            known_handles: Window handles that existed before the action
+            timeout: Custom timeout
+            
+        Returns:
+            True if a new window opened, False otherwise
+        """
+        try:
+            self._get_wait(timeout).until(EC.new_window_is_opened(known_handles))
+            return True
+        except TimeoutException:
+            return False
+    
     @log_action
     def scroll_to_element(self, locator: tuple):
         """
@@ -251,10 +737,20 @@ class BasePage:
         Args:
             locator: Tuple of (By, value)
         """
-        element = self.find_element(locator)
-        self.driver.execute_script("arguments[0].scrollIntoView(true);", element)
+        self._with_cached_element(locator, self.scroll_element_into_view)
         logger.info(f"Scrolled to element: {locator}")
     
+    def scroll_element_into_view(self, element):
+        """
+        Scroll an already located element into view.
+        
+        Args:
+            element: WebElement to scroll to
+        """
+        self.driver.execute_script(
+            "arguments[0].scrollIntoView({block: 'center', behavior: 'instant'});", element
+        )
+    
     @log_action
     def scroll_to_bottom(self):
         """Scroll to bottom of page."""
@@ -305,13 +801,28 @@ class BasePage:
             locator: Tuple of (By, value)
         """
         frame = self.find_element(locator)
+        self.invalidate_selector_cache()
         self.driver.switch_to.frame(frame)
     
     @log_action
     def switch_to_default_content(self):
         """Switch back to default content."""
+        self.invalidate_selector_cache()
         self.driver.switch_to.default_content()
     
+    def switch_to_window(self, handle: str):
+        """
+        Switch to another window or tab.
+        
+        Args:
+            handle: Window handle
+        """
+        self.invalidate_selector_cache()
+        self.driver.switch_to.window(handle)
+        # The CDP block list is per tab, so carry it over to the new one
+        if Config.BLOCK_RESOURCES:
+            DriverFactory.block_resources(self.driver)
+    
     def take_screenshot(self, name: str = "screenshot") -> str:
         """
         Take a screenshot.
@@ -322,24 +833,117 @@ class BasePage:
         Returns:
             Screenshot path
         """
-        from utils.helpers import FileHelper
         screenshot_path = FileHelper.save_screenshot(self.driver, name)
         return str(screenshot_path)
     
     @log_action
     def refresh_page(self):
         """Refresh the current page."""
+        self.invalidate_selector_cache()
         self.driver.refresh()
     
     def wait_for_page_load(self, timeout: int = None):
         """
-        Wait for page to load completely.
+        Wait for page to load as far as the configured page load strategy requires.
+        
+        With the "eager" strategy the DOM being parsed is enough; otherwise the
+        load event (images, stylesheets, iframes) is awaited.
         
         Args:
             timeout: Custom timeout
         """
         timeout = timeout or Config.PAGE_LOAD_TIMEOUT
-        WebDriverWait(self.driver, timeout).until(
-            lambda driver: driver.execute_script("return document.readyState") == "complete"
-        )
+        eager = Config.PAGE_LOAD_STRATEGY == "eager"
+        ready_states = ("interactive", "complete") if eager else ("complete",)
+        # The JS timer must fire before the driver's script timeout for the result to come back
+        long_wait = timeout >= Config.SCRIPT_TIMEOUT
+        if long_wait:
+            self.driver.set_script_timeout(timeout + 5)
+        try:
+            # Block on the load event in one round-trip instead of polling readyState
+            loaded = self.driver.execute_async_script(LOAD_EVENT_SCRIPT, timeout * 1000, eager)
+        except ScriptTimeoutException:
+            raise TimeoutException(f"Page did not load within {timeout}s")
+        except WebDriverException as e:
+            # Script was interrupted (e.g. by a navigation); fall back to polling
+            logger.debug(f"Load event wait failed, polling readyState: {e}")
+            self._get_wait(timeout).until(
+                lambda driver: driver.execute_script("return document.readyState") in ready_states
+            )
+        else:
+            if not loaded:
+                raise TimeoutException(f"Page did not load within {timeout}s")
+        finally:
+            if long_wait:
+                self.driver.set_script_timeout(Config.SCRIPT_TIMEOUT)
         logger.info("Page loaded completely")
+    
+    def wait_for_dom_quiet(self, quiet_ms: int = None, timeout: int = None) -> bool:
+        """
+        Wait until the DOM stops changing.
+        
+        Args:
+            quiet_ms: Milliseconds without mutations that count as settled
+            timeout: Maximum time to wait in seconds
+            
+        Returns:
+            True if the DOM settled, False if it was still changing at the timeout
+        """
+        quiet_ms = quiet_ms or Config.DOM_QUIET_MS
+        timeout = timeout or Config.DOM_QUIET_TIMEOUT
+        try:
+            quiet = self.driver.execute_async_script(DOM_QUIET_SCRIPT, quiet_ms, timeout * 1000)
+        except WebDriverException as e:
+            # Interrupted by a navigation; the caller's own waits take over
+            logger.debug(f"DOM quiescence wait failed: {e}")
+            return False
+        if not quiet:
+            logger.debug(f"DOM still changing after {timeout}s")
+        return quiet
+    
+    def wait_for_network_quiet(self, quiet_ms: int = None, timeout: int = None) -> bool:
+        """
+        Wait until the page stops finishing network requests.
+        
+        Args:
+            quiet_ms: Milliseconds without completed requests that count as idle
+            timeout: Maximum time to wait in seconds
+            
+        Returns:
+            True if the network went idle, False otherwise
+        """
+        quiet_ms = quiet_ms or Config.NETWORK_QUIET_MS
+        timeout = timeout or Config.DOM_QUIET_TIMEOUT
+        try:
+            quiet = self.driver.execute_async_script(NETWORK_QUIET_SCRIPT, quiet_ms, timeout * 1000)
+        except WebDriverException as e:
+            logger.debug(f"Network quiescence wait failed: {e}")
+            return False
+        if not quiet:
+            logger.debug(f"Network still busy after {timeout}s")
+        return quiet
+    
+    def wait_for_ready_and(self, script: str, *args):
+        """
+        Wait for the DOM to be parsed and run a snippet in the same call.
+        
+        The snippet is the body of an async function receiving ``args`` (the extra
+        arguments) and ``done`` (the callback that must be invoked with the result).
+        
+        Args:
+            script: JavaScript function body to run once the page is ready
+            *args: Arguments to pass to the snippet
+            
+        Returns:
+            Value passed to ``done`` by the snippet
+        """
+        wrapper = (
+            "var args = Array.prototype.slice.call(arguments, 0, -1);"
+            "var done = arguments[arguments.length - 1];"
+            "var run = function(args, done) {" + script + "};"
+            "(function poll() {"
+            "  if (document.readyState !== 'loading') { run(args, done); }"
+            "  else { setTimeout(poll, 50); }"
+            "})();"
+        )
+        return self.driver.execute_async_script(wrapper, *args)
@@ -3,14 +3,15 @@ Home Page module.
 Contains page object for Booking.com homepage.
 """
 
+import functools
+from urllib.parse import urlencode
 from selenium.webdriver.common.by import By
 from selenium.webdriver.common.keys import Keys
 from pages.base_page import BasePage
+from pages.search_results_page import SearchResultsPage
 from config.config import Config
 from utils.logger import get_logger
 from utils.decorators import allure_step
-import allure
-import time
 
 logger = get_logger(__name__)
 
@@ -18,14 +19,16 @@ logger = get_logger(__name__)
 class HomePage(BasePage):
     """Page object for Booking.com homepage."""
     
+    __slots__ = ()
+    
     # Locators
     COOKIE_ACCEPT_BUTTON = (By.ID, "onetrust-accept-btn-handler")
     COOKIE_BANNER = (By.ID, "onetrust-banner-sdk")
     DESTINATION_INPUT = (By.CSS_SELECTOR, "input[name='ss']")
     DESTINATION_INPUT_ALT = (By.CSS_SELECTOR, "input[placeholder*='Where are you going']")
+    AUTOCOMPLETE_OPTIONS = (By.CSS_SELECTOR, "ul[role='listbox'] li")
     DATE_PICKER = (By.CSS_SELECTOR, "div[data-testid='searchbox-dates-container']")
-    CHECK_IN_DATE = (By.CSS_SELECTOR, "span[data-date='{}']")
-    CHECK_OUT_DATE = (By.CSS_SELECTOR, "span[data-date='{}']")
+    DATE_PICKER_CALENDAR = (By.CSS_SELECTOR, "div[data-testid='searchbox-datepicker-calendar']")
     CALENDAR_NEXT_BUTTON = (By.CSS_SELECTOR, "button[aria-label*='Next month']")
     GUESTS_BUTTON = (By.CSS_SELECTOR, "button[data-testid='occupancy-config']")
     ADULTS_DECREASE = (By.CSS_SELECTOR, "button[aria-label*='Decrease number of Adults']")
@@ -37,6 +40,49 @@ class HomePage(BasePage):
     SEARCH_BUTTON = (By.CSS_SELECTOR, "button[type='submit']")
     SEARCH_BUTTON_ALT = (By.CSS_SELECTOR, "button span.e4adce92df")
     
+    # Session ids of drivers that already accepted cookies; consent is kept
+    # for the lifetime of the browser session
+    _cookie_dismissed = set()
+    
+    # Clicks arguments[0] arguments[1] times
+    REPEAT_CLICK_SCRIPT = "var b = arguments[0], n = arguments[1]; for (var i = 0; i < n; i++) { b.click(); }"
+    
+    # Accepts the cookie banner if it shows up within args[2] ms and resolves
+    # once it is gone: "absent", "closed" or "timeout".
+    COOKIE_DISMISS_SCRIPT = """
+        var bannerId = args[0], acceptId = args[1], waitMs = args[2];
+        var finished = false;
+        var observer = new MutationObserver(check);
+        function finish(status) {
+            if (finished) { return; }
+            finished = true;
+            observer.disconnect();
+            done(status);
+        }
+        function isShown(el) {
+            return !!el && el.offsetParent !== null;
+        }
+        var clicked = false;
+        function check() {
+            var banner = document.getElementById(bannerId);
+            if (!clicked) {
+                var accept = document.getElementById(acceptId);
+                if (isShown(banner) && accept) {
+                    accept.click();
+                    clicked = true;
+                }
+            }
+            if (clicked && !isShown(document.getElementById(bannerId))) {
+                finish("closed");
+            }
+        }
+        observer.observe(document.documentElement, {
+            childList: true, subtree: true, attributes: true, attributeFilter: ["style", "class"]
+        });
+        check();
+        setTimeout(function() { finish(clicked ? "timeout" : "absent"); }, waitMs);
+    """
+    
     def __init__(self, driver):
         """
         Initialize HomePage.
@@ -50,23 +96,46 @@ class HomePage(BasePage):
     def open(self):
         """Open the homepage."""
         self.open_url(Config.BASE_URL)
-        self.wait_for_page_load()
-        time.sleep(2)  # Allow page to settle
         self.close_cookie_banner()
     
     @allure_step("Close cookie consent banner")
     def close_cookie_banner(self):
         """Close cookie consent banner if present."""
+        session_id = self.driver.session_id
+        if session_id in HomePage._cookie_dismissed:
+            logger.info("Cookie banner already dismissed in this session")
+            return
+        
         try:
-            if self.is_element_visible(self.COOKIE_BANNER, timeout=5):
-                logger.info("Cookie banner detected, attempting to close")
-                self.click(self.COOKIE_ACCEPT_BUTTON, timeout=5)
-                self.wait_for_invisibility(self.COOKIE_BANNER, timeout=5)
+            # Page readiness, banner detection, accept click and close detection
+            # all happen inside a single async script round-trip
+            status = self.wait_for_ready_and(
+                self.COOKIE_DISMISS_SCRIPT,
+                self.COOKIE_BANNER[1],
+                self.COOKIE_ACCEPT_BUTTON[1],
+                5000
+            )
+            if status == "closed":
+                HomePage._cookie_dismissed.add(session_id)
                 logger.info("Cookie banner closed")
-                time.sleep(1)
+            elif status == "timeout":
+                logger.warning("Cookie banner accepted but still visible")
         except Exception as e:
             logger.warning(f"Could not close cookie banner: {e}")
     
+    @classmethod
+    def reset_cookie_cache(cls, driver=None):
+        """
+        Forget cookie banner dismissals.
+        
+        Args:
+            driver: WebDriver whose dismissal should be forgotten (all if not provided)
+        """
+        if driver is None:
+            cls._cookie_dismissed.clear()
+        else:
+            cls._cookie_dismissed.discard(driver.session_id)
+    
     @allure_step("Enter destination: {destination}")
     def enter_destination(self, destination: str):
         """
@@ -76,24 +145,21 @@ class HomePage(BasePage):
             destination: Destination name
         """
         try:
-            # Try primary locator
-            if self.is_element_visible(self.DESTINATION_INPUT, timeout=5):
-                self.click(self.DESTINATION_INPUT)
-                self.type_text(self.DESTINATION_INPUT, destination)
-            else:
-                # Try alternative locator
-                self.click(self.DESTINATION_INPUT_ALT)
-                self.type_text(self.DESTINATION_INPUT_ALT, destination)
+            # Resolve whichever destination input is present with one probe
+            element = self.find_first_element(self.DESTINATION_INPUT, self.DESTINATION_INPUT_ALT)
+            element.click()
+            self.type_into_element(element, destination)
             
-            time.sleep(2)  # Wait for autocomplete
+            # Wait for autocomplete suggestions
+            if not self.is_element_visible(self.AUTOCOMPLETE_OPTIONS, timeout=5):
+                logger.warning("Autocomplete suggestions did not appear")
             
-            # Press Enter or Down+Enter to select first suggestion
-            element = self.find_element(self.DESTINATION_INPUT) if self.is_element_present(self.DESTINATION_INPUT) else self.find_element(self.DESTINATION_INPUT_ALT)
+            # Press Down+Enter to select first suggestion
             element.send_keys(Keys.ARROW_DOWN)
             element.send_keys(Keys.ENTER)
             
             logger.info(f"Entered destination: {destination}")
-            allure.attach(destination, name="Destination", attachment_type=allure.attachment_type.TEXT)
+            self.attach("Destination", destination)
         except Exception as e:
             logger.error(f"Failed to enter destination: {e}")
             raise
@@ -108,14 +174,14 @@ class HomePage(BasePage):
         """
         try:
             # Open date picker if not already open
-            if not self.is_element_visible((By.CSS_SELECTOR, "div[data-testid='searchbox-datepicker-calendar']"), timeout=3):
+            if not self.is_element_visible(self.DATE_PICKER_CALENDAR, timeout=3):
                 self.click(self.DATE_PICKER)
-                time.sleep(1)
+                self.is_element_visible(self.DATE_PICKER_CALENDAR, timeout=5)
             
             # Navigate to correct month if needed and select date
             self._select_date(check_in_date)
             logger.info(f"Selected check-in date: {check_in_date}")
-            allure.attach(check_in_date, name="Check-in Date", attachment_type=allure.attachment_type.TEXT)
+            self.attach("Check-in Date", check_in_date)
         except Exception as e:
             logger.error(f"Failed to select check-in date: {e}")
             raise
@@ -131,11 +197,25 @@ class HomePage(BasePage):
         try:
             self._select_date(check_out_date)
             logger.info(f"Selected check-out date: {check_out_date}")
-            allure.attach(check_out_date, name="Check-out Date", attachment_type=allure.attachment_type.TEXT)
+            self.attach("Check-out Date", check_out_date)
         except Exception as e:
             logger.error(f"Failed to select check-out date: {e}")
             raise
     
+    @staticmethod
+    @functools.lru_cache(maxsize=512)
+    def _date_locator(date: str) -> tuple:
+        """
+        Build (and cache) the calendar cell locator for a date.
+        
+        Args:
+            date: Date in format YYYY-MM-DD
+            
+        Returns:
+            Tuple of (By, value)
+        """
+        return (By.CSS_SELECTOR, f"span[data-date='{date}']")
+    
     def _select_date(self, date: str):
         """
         Internal method to select a date from calendar.
@@ -143,19 +223,21 @@ class HomePage(BasePage):
         Args:
             date: Date in format YYYY-MM-DD
         """
-        date_locator = (By.CSS_SELECTOR, f"span[data-date='{date}']")
+        date_locator = self._date_locator(date)
+        next_button = self.CALENDAR_NEXT_BUTTON
+        is_visible = self.is_element_visible
+        click = self.click
         
         # Try to find and click the date (may need to navigate months)
         max_attempts = 12  # Maximum 12 months to search
         for _ in range(max_attempts):
-            if self.is_element_visible(date_locator, timeout=2):
-                self.click(date_locator)
+            if is_visible(date_locator, timeout=2):
+                click(date_locator)
                 return
             else:
                 # Click next month button
                 try:
-                    self.click(self.CALENDAR_NEXT_BUTTON, timeout=2)
-                    time.sleep(0.5)
+                    click(next_button, timeout=2)
                 except:
                     break
         
@@ -174,7 +256,7 @@ class HomePage(BasePage):
         try:
             # Open guests selector
             self.click(self.GUESTS_BUTTON)
-            time.sleep(1)
+            self.is_element_visible(self.ADULTS_INCREASE, timeout=5)
             
             # Set adults (default is usually 2, so adjust accordingly)
             self._adjust_counter(self.ADULTS_DECREASE, self.ADULTS_INCREASE, adults, default=2)
@@ -186,14 +268,10 @@ class HomePage(BasePage):
             self._adjust_counter(self.ROOMS_DECREASE, self.ROOMS_INCREASE, rooms, default=1)
             
             logger.info(f"Configured guests: {adults} adults, {children} children, {rooms} rooms")
-            allure.attach(
-                f"Adults: {adults}, Children: {children}, Rooms: {rooms}",
-                name="Guest Configuration",
-                attachment_type=allure.attachment_type.TEXT
+            self.attach(
+                "Guest Configuration",
+                f"Adults: {adults}, Children: {children}, Rooms: {rooms}"
             )
-            
-            # Close the guests selector (click outside or on a specific close button)
-            time.sleep(0.5)
         except Exception as e:
             logger.error(f"Failed to configure guests: {e}")
             raise
@@ -208,31 +286,30 @@ class HomePage(BasePage):
             target: Target value
             default: Default value
         """
-        current = default
+        delta = target - default
+        if delta == 0:
+            return
         
-        while current < target:
-            self.click(increase_locator)
-            current += 1
-            time.sleep(0.3)
-        
-        while current > target:
-            self.click(decrease_locator)
-            current -= 1
-            time.sleep(0.3)
+        # Fire all clicks in one round-trip instead of one command per step
+        button = self.wait_for_clickable(increase_locator if delta > 0 else decrease_locator)
+        self.execute_script(self.REPEAT_CLICK_SCRIPT, button, abs(delta))
     
     @allure_step("Click search button")
-    def click_search(self):
-        """Click the search button."""
+    def click_search(self) -> SearchResultsPage:
+        """
+        Click the search button.
+        
+        Returns:
+            SearchResultsPage for the page the search navigated to
+        """
         try:
-            # Try primary search button
-            if self.is_element_visible(self.SEARCH_BUTTON, timeout=5):
-                self.click(self.SEARCH_BUTTON)
-            else:
-                # Try alternative search button
-                self.click(self.SEARCH_BUTTON_ALT)
+            # Primary and alternative buttons share one wait window
+            self.click_any(self.SEARCH_BUTTON, self.SEARCH_BUTTON_ALT, timeout=10)
             
             logger.info("Clicked search button")
-            time.sleep(2)  # Wait for search results to load
+            if not self.wait_for_url_contains("searchresults", timeout=10):
+                logger.warning("Search results URL not reached after clicking search")
+            return SearchResultsPage(self.driver)
         except Exception as e:
             logger.error(f"Failed to click search button: {e}")
             raise
@@ -244,8 +321,7 @@ class HomePage(BasePage):
         Returns:
             True if loaded, False otherwise
         """
-        return self.is_element_visible(self.DESTINATION_INPUT, timeout=10) or \
-               self.is_element_visible(self.DESTINATION_INPUT_ALT, timeout=10)
+        return self.is_any_element_visible(self.DESTINATION_INPUT, self.DESTINATION_INPUT_ALT, timeout=10)
     
     @allure_step("Perform search - Destination: {destination}")
     def search(self, destination: str, check_in_date: str = None, check_out_date: str = None, 
@@ -260,6 +336,9 @@ class HomePage(BasePage):
             adults: Number of adults
             children: Number of children
             rooms: Number of rooms
+            
+        Returns:
+            SearchResultsPage for the search results
         """
         self.enter_destination(destination)
         
@@ -268,4 +347,31 @@ class HomePage(BasePage):
             self.select_check_out_date(check_out_date)
         
         self.select_guests(adults, children, rooms)
-        self.click_search()
+        return self.click_search()
+    
+    @allure_step("Open search results via URL - Destination: {destination}")
+    def search_via_url(self, destination: str, check_in_date: str = None, check_out_date: str = None,
+                       adults: int = 2, children: int = 0, rooms: int = 1):
+        """
+        Open search results directly through URL parameters, skipping the search form.
+        
+        Args:
+            destination: Destination name
+            check_in_date: Check-in date (YYYY-MM-DD)
+            check_out_date: Check-out date (YYYY-MM-DD)
+            adults: Number of adults
+            children: Number of children
+            rooms: Number of rooms
+            
+        Returns:
+            SearchResultsPage for the search results
+        """
+        params = {"ss": destination}
+        if check_in_date and check_out_date:
+            params["checkin"] = check_in_date
+            params["checkout"] = check_out_date
+        params.update(group_adults=adults, group_children=children, no_rooms=rooms)
+        
+        self.open_url(f"{Config.SEARCH_RESULTS_URL}?{urlencode(params)}")
+        self.close_cookie_banner()
+        return SearchResultsPage(self.driver)
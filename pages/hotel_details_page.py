@@ -3,12 +3,13 @@ Hotel Details Page module.
 Contains page object for Booking.com hotel details page.
 """
 
+import time
 from selenium.webdriver.common.by import By
-from pages.base_page import BasePage
+from selenium.common.exceptions import TimeoutException
+from pages.base_page import BasePage, LOOKUP_ERRORS
+from config.config import Config
 from utils.logger import get_logger
 from utils.decorators import allure_step
-import allure
-import time
 
 logger = get_logger(__name__)
 
@@ -38,6 +39,22 @@ class HotelDetailsPage(BasePage):
             driver: WebDriver instance
         """
         super().__init__(driver)
+        # Monotonic time at which the page was last proven loaded
+        self._loaded_at = None
+    
+    def _recently_loaded(self) -> bool:
+        """
+        Check whether the page was proven loaded within Config.LOADED_STATE_TTL.
+        
+        Returns:
+            True if a recent load check can be reused
+        """
+        return self._loaded_at is not None and time.monotonic() - self._loaded_at < Config.LOADED_STATE_TTL
+    
+    def invalidate_selector_cache(self):
+        """Forget cached elements and the cached load state (after navigation or DOM-changing actions)."""
+        super().invalidate_selector_cache()
+        self._loaded_at = None
     
     def is_loaded(self) -> bool:
         """
@@ -46,15 +63,75 @@ class HotelDetailsPage(BasePage):
         Returns:
             True if loaded, False otherwise
         """
-        return self.is_element_visible(self.HOTEL_NAME, timeout=15) or \
-               self.is_element_visible(self.HOTEL_NAME_ALT, timeout=15)
+        if self._recently_loaded():
+            return True
+        loaded = self.is_ready_with_any(self.HOTEL_NAME, self.HOTEL_NAME_ALT, timeout=15)
+        if loaded:
+            self._loaded_at = time.monotonic()
+        return loaded
     
     def wait_for_page_to_load(self):
         """Wait for hotel details page to load completely."""
+        if self._recently_loaded():
+            return
         self.wait_for_page_load()
-        time.sleep(2)  # Additional wait for dynamic content
+        # Wait for the dynamically rendered header, then for the rest of the page to settle
+        self.is_any_element_visible(self.HOTEL_NAME, self.HOTEL_NAME_ALT, timeout=10)
+        self.wait_for_dom_quiet()
         logger.info("Hotel details page loaded")
     
+    @staticmethod
+    def _rating_text(match: dict) -> str:
+        """
+        Get the rating value from a HOTEL_RATING / HOTEL_RATING_ALT match.
+        
+        Args:
+            match: Dict with index, text and aria keys
+            
+        Returns:
+            Rating text
+        """
+        # Star rating exposes its value through aria-label, review score through text
+        return (match["aria"] or match["text"]) if match["index"] == 0 else match["text"]
+    
+    @allure_step("Get hotel information")
+    def get_all_info(self) -> dict:
+        """
+        Get hotel name, rating, price and amenities in one script call.
+        
+        Amenities are read as currently rendered; use get_amenities() to scroll
+        the section into view first.
+        
+        Returns:
+            Dict with name, rating, price and amenities keys, using the same
+            fallbacks as the individual getters
+        """
+        try:
+            self.wait_for_page_to_load()
+            snapshot = self._read_snapshot(
+                {
+                    "name": [self.HOTEL_NAME, self.HOTEL_NAME_ALT],
+                    "rating": [self.HOTEL_RATING, self.HOTEL_RATING_ALT],
+                    "price": [self.HOTEL_PRICE, self.HOTEL_PRICE_ALT],
+                },
+                {"amenities": self.AMENITIES_LIST}
+            )
+        except LOOKUP_ERRORS as e:
+            logger.error(f"Failed to get hotel information: {e}")
+            snapshot = {}
+        
+        name, rating, price = snapshot.get("name"), snapshot.get("rating"), snapshot.get("price")
+        info = {
+            "name": name["text"] if name else "",
+            "rating": self._rating_text(rating) if rating else "N/A",
+            "price": price["text"] if price else "N/A",
+            "amenities": snapshot.get("amenities") or [],
+        }
+        
+        logger.info(f"Hotel information: {info['name']} ({info['rating']}, {info['price']})")
+        self.attach("Hotel Information", info)
+        return info
+    
     @allure_step("Get hotel name")
     def get_hotel_name(self) -> str:
         """
@@ -66,17 +143,16 @@ class HotelDetailsPage(BasePage):
         try:
             self.wait_for_page_to_load()
             
-            # Try primary locator
-            if self.is_element_visible(self.HOTEL_NAME, timeout=5):
-                name = self.get_text(self.HOTEL_NAME)
-            else:
-                # Try alternative locator
-                name = self.get_text(self.HOTEL_NAME_ALT)
+            match = self._query_first([self.HOTEL_NAME, self.HOTEL_NAME_ALT], timeout=5)
+            if match is None:
+                logger.warning("Hotel name not found")
+                return ""
+            name = match["text"]
             
             logger.info(f"Hotel name: {name}")
-            allure.attach(name, name="Hotel Name", attachment_type=allure.attachment_type.TEXT)
+            self.attach("Hotel Name", name)
             return name
-        except Exception as e:
+        except LOOKUP_ERRORS as e:
             logger.error(f"Failed to get hotel name: {e}")
             return ""
     
@@ -89,23 +165,16 @@ class HotelDetailsPage(BasePage):
             Hotel rating
         """
         try:
-            # Try to get star rating
-            if self.is_element_visible(self.HOTEL_RATING, timeout=5):
-                rating_element = self.find_element(self.HOTEL_RATING)
-                # Get aria-label or count stars
-                rating = rating_element.get_attribute("aria-label")
-                logger.info(f"Hotel rating: {rating}")
-                allure.attach(rating, name="Hotel Rating", attachment_type=allure.attachment_type.TEXT)
-                return rating
-            elif self.is_element_visible(self.HOTEL_RATING_ALT, timeout=5):
-                rating = self.get_text(self.HOTEL_RATING_ALT)
-                logger.info(f"Hotel rating: {rating}")
-                allure.attach(rating, name="Hotel Rating", attachment_type=allure.attachment_type.TEXT)
-                return rating
-            else:
+            match = self._query_first([self.HOTEL_RATING, self.HOTEL_RATING_ALT], timeout=5)
+            if match is None:
                 logger.warning("Rating not found")
                 return "N/A"
-        except Exception as e:
+            
+            rating = self._rating_text(match)
+            logger.info(f"Hotel rating: {rating}")
+            self.attach("Hotel Rating", rating)
+            return rating
+        except LOOKUP_ERRORS as e:
             logger.error(f"Failed to get hotel rating: {e}")
             return "N/A"
     
@@ -118,17 +187,16 @@ class HotelDetailsPage(BasePage):
             Hotel price
         """
         try:
-            # Try primary locator
-            if self.is_element_visible(self.HOTEL_PRICE, timeout=5):
-                price = self.get_text(self.HOTEL_PRICE)
-            else:
-                # Try alternative locator
-                price = self.get_text(self.HOTEL_PRICE_ALT)
+            match = self._query_first([self.HOTEL_PRICE, self.HOTEL_PRICE_ALT], timeout=5)
+            if match is None:
+                logger.warning("Hotel price not found")
+                return "N/A"
+            price = match["text"]
             
             logger.info(f"Hotel price: {price}")
-            allure.attach(price, name="Hotel Price", attachment_type=allure.attachment_type.TEXT)
+            self.attach("Hotel Price", price)
             return price
-        except Exception as e:
+        except LOOKUP_ERRORS as e:
             logger.warning(f"Could not get hotel price: {e}")
             return "N/A"
     
@@ -141,24 +209,19 @@ class HotelDetailsPage(BasePage):
             List of amenities
         """
         try:
-            if self.is_element_visible(self.AMENITIES_SECTION, timeout=5):
+            # Optional section below the fold: DOM presence is enough, it is scrolled into view next
+            if self.is_element_present(self.AMENITIES_SECTION, timeout=2):
                 self.scroll_to_element(self.AMENITIES_SECTION)
-                time.sleep(1)
                 
-                amenity_elements = self.find_elements(self.AMENITIES_LIST, timeout=5)
-                amenities = [element.text for element in amenity_elements if element.text]
+                amenities = self.get_all_texts_stable(self.AMENITIES_LIST, timeout=5)
                 
                 logger.info(f"Found {len(amenities)} amenities")
-                allure.attach(
-                    "\n".join(amenities),
-                    name="Amenities",
-                    attachment_type=allure.attachment_type.TEXT
-                )
+                self.attach("Amenities", amenities)
                 return amenities
             else:
                 logger.warning("Amenities section not found")
                 return []
-        except Exception as e:
+        except LOOKUP_ERRORS as e:
             logger.error(f"Failed to get amenities: {e}")
             return []
     
@@ -169,18 +232,15 @@ class HotelDetailsPage(BasePage):
             # Scroll to availability button
             if self.is_element_visible(self.AVAILABILITY_BUTTON, timeout=5):
                 self.scroll_to_element(self.AVAILABILITY_BUTTON)
-                time.sleep(1)
                 self.click(self.AVAILABILITY_BUTTON)
             elif self.is_element_visible(self.AVAILABILITY_BUTTON_ALT, timeout=5):
                 self.scroll_to_element(self.AVAILABILITY_BUTTON_ALT)
-                time.sleep(1)
                 self.click(self.AVAILABILITY_BUTTON_ALT)
             else:
                 logger.warning("Availability button not found")
                 return
             
             logger.info("Clicked availability button")
-            time.sleep(2)
         except Exception as e:
             logger.error(f"Failed to check availability: {e}")
             raise
@@ -193,21 +253,35 @@ class HotelDetailsPage(BasePage):
         Returns:
             True if details are loaded, False otherwise
         """
+        if self._recently_loaded():
+            logger.info("Hotel details already verified as loaded")
+            return True
+        
         try:
-            # Check for hotel name
-            has_name = self.is_element_visible(self.HOTEL_NAME, timeout=10) or \
-                       self.is_element_visible(self.HOTEL_NAME_ALT, timeout=10)
+            groups = {
+                "name": [self.HOTEL_NAME, self.HOTEL_NAME_ALT],
+                "photos": [self.PHOTOS_SECTION],
+            }
+            
+            def name_present(driver):
+                result = self._probe_presence(groups)
+                return result if result["ready"] and result["name"] else False
             
-            if not has_name:
+            # Readiness, name and photos are probed together; poll until the name shows up
+            try:
+                probe = self._get_wait(10, Config.LOAD_POLL_FREQUENCY).until(name_present)
+            except TimeoutException:
                 logger.error("Hotel name not found")
                 return False
             
-            # Check for photos section
-            has_photos = self.is_element_visible(self.PHOTOS_SECTION, timeout=5)
+            has_name = probe["name"]
+            has_photos = probe["photos"]
             
             logger.info(f"Hotel details loaded - Name: {has_name}, Photos: {has_photos}")
+            if has_name:
+                self._loaded_at = time.monotonic()
             return has_name
-        except Exception as e:
+        except LOOKUP_ERRORS as e:
             logger.error(f"Failed to verify hotel details: {e}")
             return False
     
@@ -219,7 +293,7 @@ class HotelDetailsPage(BasePage):
             Hotel description text
         """
         try:
-            if self.is_element_visible(self.DESCRIPTION, timeout=5):
+            if self.is_element_present(self.DESCRIPTION, timeout=2):
                 self.scroll_to_element(self.DESCRIPTION)
                 description = self.get_text(self.DESCRIPTION)
                 logger.info("Retrieved hotel description")
@@ -227,6 +301,6 @@ class HotelDetailsPage(BasePage):
             else:
                 logger.warning("Description not found")
                 return ""
-        except Exception as e:
+        except LOOKUP_ERRORS as e:
             logger.error(f"Failed to get description: {e}")
             return ""
@@ -4,15 +4,31 @@ Contains page object for Booking.com search results page.
 """
 
 from selenium.webdriver.common.by import By
-from pages.base_page import BasePage
+from selenium.common.exceptions import NoSuchElementException
+from pages.base_page import BasePage, LOOKUP_ERRORS
+from config.config import Config
 from utils.logger import get_logger
 from utils.decorators import allure_step
-import allure
-import time
+from utils.fast_scrape import FastScraper, FAST_SCRAPE_AVAILABLE
 
 logger = get_logger(__name__)
 
 
+def _format_locators(template: tuple, values) -> dict:
+    """
+    Build the locators of a parameterized locator template up front.
+    
+    Args:
+        template: Tuple of (By, value) whose value contains a ``{}`` placeholder
+        values: Values to substitute into the placeholder
+        
+    Returns:
+        Dictionary mapping each value to its locator
+    """
+    by, selector = template
+    return {value: (by, selector.format(value)) for value in values}
+
+
 class SearchResultsPage(BasePage):
     """Page object for Booking.com search results page."""
     
@@ -21,18 +37,20 @@ class SearchResultsPage(BasePage):
     PROPERTY_CARDS = (By.CSS_SELECTOR, "div[data-testid='property-card']")
     PROPERTY_TITLES = (By.CSS_SELECTOR, "div[data-testid='title']")
     PROPERTY_PRICES = (By.CSS_SELECTOR, "span[data-testid='price-and-discounted-price']")
-    FIRST_PROPERTY = (By.CSS_SELECTOR, "div[data-testid='property-card']:first-of-type")
-    FIRST_PROPERTY_TITLE = (By.CSS_SELECTOR, "div[data-testid='property-card']:first-of-type div[data-testid='title']")
     
     # Filter locators
     PRICE_FILTER_MIN = (By.CSS_SELECTOR, "input[name='price_filter_min']")
     PRICE_FILTER_MAX = (By.CSS_SELECTOR, "input[name='price_filter_max']")
     STAR_RATING_FILTER = (By.CSS_SELECTOR, "div[data-filters-group='class'] input[value='{}']")
+    STAR_RATING_LOCATORS = _format_locators(STAR_RATING_FILTER, range(1, 6))
     FILTER_BUTTON = (By.CSS_SELECTOR, "button[data-testid='filter-button']")
     
     # Sort locators
     SORT_DROPDOWN = (By.CSS_SELECTOR, "button[data-testid='sorters-dropdown-trigger']")
     SORT_OPTION = (By.CSS_SELECTOR, "button[data-id='{}']")
+    SORT_OPTION_LOCATORS = _format_locators(
+        SORT_OPTION, ("price", "review_score_and_price", "distance", "popularity", "class_descending")
+    )
     
     # Results info
     RESULTS_COUNT = (By.CSS_SELECTOR, "h1")
@@ -46,6 +64,15 @@ class SearchResultsPage(BasePage):
             driver: WebDriver instance
         """
         super().__init__(driver)
+        # Property cards captured by the last wait_for_results_to_load()
+        self._cards = []
+        # (url, (names, prices)) of the last HTTP scrape, shared by the name and price getters
+        self._scraped = None
+    
+    def invalidate_selector_cache(self):
+        """Forget cached elements and scraped results (after navigation or DOM-changing actions)."""
+        super().invalidate_selector_cache()
+        self._scraped = None
     
     def is_loaded(self) -> bool:
         """
@@ -54,17 +81,67 @@ class SearchResultsPage(BasePage):
         Returns:
             True if loaded, False otherwise
         """
-        return self.is_element_visible(self.SEARCH_RESULTS_CONTAINER, timeout=15)
+        return self.is_element_present(self.SEARCH_RESULTS_CONTAINER, timeout=10)
     
     def wait_for_results_to_load(self):
         """Wait for search results to load completely."""
         # Wait for loading indicator to disappear
         self.wait_for_invisibility(self.LOADING_INDICATOR, timeout=20)
-        # Wait for property cards to be visible
-        self.is_element_visible(self.PROPERTY_CARDS, timeout=15)
-        time.sleep(2)  # Additional wait for dynamic content
+        # Let the list finish rendering so the cached cards don't go stale
+        self.wait_for_dom_quiet()
+        # Wait for property cards to be present and keep them for indexed access
+        self._cards = self.find_elements(self.PROPERTY_CARDS, timeout=10)
         logger.info("Search results loaded")
     
+    def _first_card(self):
+        """
+        Get the first property card currently rendered.
+        
+        Returns:
+            WebElement or None if no card is present
+        """
+        cards = self.driver.find_elements(*self.PROPERTY_CARDS)
+        return cards[0] if cards else None
+    
+    def _first_card_title(self):
+        """
+        Get the title element of the first cached property card.
+        
+        Returns:
+            WebElement
+            
+        Raises:
+            NoSuchElementException: If no property card is loaded
+        """
+        if not self._cards:
+            raise NoSuchElementException("No property cards loaded")
+        return self._cards[0].find_element(*self.PROPERTY_TITLES)
+    
+    def _wait_for_results_refresh(self, old_card):
+        """
+        Wait for the results list to re-render after a filter or sort change.
+        
+        Args:
+            old_card: Property card captured before the change (may be None)
+        """
+        if old_card is not None and not self.wait_for_staleness(old_card, timeout=10):
+            logger.warning("Results did not refresh after change")
+        # The new list is fetched over XHR; wait for those requests to land
+        self.wait_for_network_quiet()
+        self.wait_for_results_to_load()
+    
+    @allure_step("Clear all filters")
+    def clear_all_filters(self, search_url: str):
+        """
+        Reload an unfiltered search so filters and sort order are back to their defaults.
+        
+        Args:
+            search_url: URL of the search results page before any filter was applied
+        """
+        self.open_url(search_url)
+        self.wait_for_results_to_load()
+        logger.info("Filters cleared")
+    
     @allure_step("Get search results count")
     def get_search_results_count(self) -> int:
         """
@@ -75,12 +152,11 @@ class SearchResultsPage(BasePage):
         """
         try:
             self.wait_for_results_to_load()
-            properties = self.find_elements(self.PROPERTY_CARDS, timeout=10)
-            count = len(properties)
+            count = len(self._cards)
             logger.info(f"Found {count} properties")
-            allure.attach(str(count), name="Results Count", attachment_type=allure.attachment_type.TEXT)
+            self.attach("Results Count", count)
             return count
-        except Exception as e:
+        except LOOKUP_ERRORS as e:
             logger.error(f"Failed to get results count: {e}")
             return 0
     
@@ -94,11 +170,11 @@ class SearchResultsPage(BasePage):
         """
         try:
             self.wait_for_results_to_load()
-            hotel_name = self.get_text(self.FIRST_PROPERTY_TITLE, timeout=10)
+            hotel_name = self.get_element_text(self._first_card_title())
             logger.info(f"First hotel: {hotel_name}")
-            allure.attach(hotel_name, name="First Hotel", attachment_type=allure.attachment_type.TEXT)
+            self.attach("First Hotel", hotel_name)
             return hotel_name
-        except Exception as e:
+        except LOOKUP_ERRORS as e:
             logger.error(f"Failed to get first hotel name: {e}")
             return ""
     
@@ -108,23 +184,20 @@ class SearchResultsPage(BasePage):
         try:
             self.wait_for_results_to_load()
             
-            # Store the original window handle
-            original_window = self.driver.current_window_handle
+            # Store the window handles open before the click
+            known_windows = self.driver.window_handles
             
             # Click the first property
-            self.scroll_to_element(self.FIRST_PROPERTY_TITLE)
-            time.sleep(1)
-            self.click(self.FIRST_PROPERTY_TITLE)
-            
-            # Wait for new window/tab to open
-            time.sleep(3)
+            title = self._first_card_title()
+            self.scroll_element_into_view(title)
+            self.click_element(title)
             
-            # Switch to new window if opened
-            windows = self.driver.window_handles
-            if len(windows) > 1:
+            # Wait for new window/tab to open, then switch to it
+            if self.wait_for_new_window(known_windows, timeout=10):
+                windows = self.driver.window_handles
                 for window in windows:
-                    if window != original_window:
-                        self.driver.switch_to.window(window)
+                    if window not in known_windows:
+                        self.switch_to_window(window)
                         logger.info("Switched to hotel details window")
                         break
             
@@ -143,25 +216,30 @@ class SearchResultsPage(BasePage):
             max_price: Maximum price
         """
         try:
+            old_card = self._first_card()
+            entered = False
+            
             if min_price:
                 if self.is_element_visible(self.PRICE_FILTER_MIN, timeout=5):
                     self.type_text(self.PRICE_FILTER_MIN, str(min_price))
                     logger.info(f"Set minimum price: {min_price}")
+                    entered = True
             
             if max_price:
                 if self.is_element_visible(self.PRICE_FILTER_MAX, timeout=5):
                     self.type_text(self.PRICE_FILTER_MAX, str(max_price))
                     logger.info(f"Set maximum price: {max_price}")
+                    entered = True
             
-            time.sleep(2)
-            self.wait_for_results_to_load()
+            # Nothing was typed, so the results won't refresh
+            if not entered:
+                logger.warning("Price filter inputs not found")
+                return
             
-            allure.attach(
-                f"Min: {min_price}, Max: {max_price}",
-                name="Price Filter",
-                attachment_type=allure.attachment_type.TEXT
-            )
-        except Exception as e:
+            self._wait_for_results_refresh(old_card)
+            
+            self.attach("Price Filter", f"Min: {min_price}, Max: {max_price}")
+        except LOOKUP_ERRORS as e:
             logger.warning(f"Could not apply price filter: {e}")
     
     @allure_step("Apply star rating filter: {rating}")
@@ -173,24 +251,26 @@ class SearchResultsPage(BasePage):
             rating: Star rating (1-5)
         """
         try:
-            rating_locator = (By.CSS_SELECTOR, f"div[data-filters-group='class'] input[value='{rating}']")
+            rating_locator = self.STAR_RATING_LOCATORS.get(rating) or (
+                self.STAR_RATING_FILTER[0], self.STAR_RATING_FILTER[1].format(rating)
+            )
             
             if self.is_element_visible(rating_locator, timeout=5):
+                old_card = self._first_card()
+                
                 # Scroll to filter section
                 self.scroll_to_element(rating_locator)
-                time.sleep(0.5)
                 
                 # Click the rating filter
                 self.click_with_js(rating_locator)
                 logger.info(f"Applied {rating}-star rating filter")
                 
-                time.sleep(2)
-                self.wait_for_results_to_load()
+                self._wait_for_results_refresh(old_card)
                 
-                allure.attach(str(rating), name="Star Rating", attachment_type=allure.attachment_type.TEXT)
+                self.attach("Star Rating", rating)
             else:
                 logger.warning(f"Rating filter {rating} not found")
-        except Exception as e:
+        except LOOKUP_ERRORS as e:
             logger.warning(f"Could not apply rating filter: {e}")
     
     @allure_step("Sort by: {sort_option}")
@@ -204,57 +284,91 @@ class SearchResultsPage(BasePage):
         try:
             # Open sort dropdown
             if self.is_element_visible(self.SORT_DROPDOWN, timeout=5):
+                old_card = self._first_card()
                 self.click(self.SORT_DROPDOWN)
-                time.sleep(1)
                 
                 # Select sort option
-                sort_locator = (By.CSS_SELECTOR, f"button[data-id='{sort_option}']")
+                sort_locator = self.SORT_OPTION_LOCATORS.get(sort_option) or (
+                    self.SORT_OPTION[0], self.SORT_OPTION[1].format(sort_option)
+                )
                 if self.is_element_visible(sort_locator, timeout=5):
                     self.click(sort_locator)
                     logger.info(f"Sorted by: {sort_option}")
                     
-                    time.sleep(2)
-                    self.wait_for_results_to_load()
+                    self._wait_for_results_refresh(old_card)
                     
-                    allure.attach(sort_option, name="Sort Option", attachment_type=allure.attachment_type.TEXT)
+                    self.attach("Sort Option", sort_option)
                 else:
                     logger.warning(f"Sort option {sort_option} not found")
             else:
                 logger.warning("Sort dropdown not found")
-        except Exception as e:
+        except LOOKUP_ERRORS as e:
             logger.warning(f"Could not apply sort: {e}")
     
-    def get_all_property_names(self) -> list:
+    def _fast_scrape(self) -> tuple:
+        """
+        Scrape names and prices of the current results URL over HTTP, once per URL.
+        
+        Only used when Config.FAST_SCRAPE is set, since it checks a separate server response
+        rather than the page the browser rendered.
+        
+        Returns:
+            Tuple of (names, prices); empty lists if scraping is disabled or the page could not be scraped
+        """
+        if not (Config.FAST_SCRAPE and FAST_SCRAPE_AVAILABLE):
+            return [], []
+        url = self.get_current_url()
+        if self._scraped is None or self._scraped[0] != url:
+            self._scraped = (url, FastScraper.scrape_names_prices(
+                url,
+                self.driver.get_cookies(),
+                self.execute_script("return navigator.userAgent;")
+            ))
+        return self._scraped[1]
+    
+    def get_all_property_names(self, limit: int = None) -> list:
         """
         Get names of all properties on current page.
         
+        Args:
+            limit: Maximum number of names to read (all if not provided)
+            
         Returns:
             List of property names
         """
         try:
-            self.wait_for_results_to_load()
-            title_elements = self.find_elements(self.PROPERTY_TITLES, timeout=10)
-            names = [element.text for element in title_elements if element.text]
+            names, _ = self._fast_scrape()
+            if names:
+                names = names[:limit]
+            else:
+                self.wait_for_results_to_load()
+                names = self.get_all_texts(self.PROPERTY_TITLES, limit)
             logger.info(f"Retrieved {len(names)} property names")
             return names
-        except Exception as e:
+        except LOOKUP_ERRORS as e:
             logger.error(f"Failed to get property names: {e}")
             return []
     
-    def get_all_property_prices(self) -> list:
+    def get_all_property_prices(self, limit: int = None) -> list:
         """
         Get prices of all properties on current page.
         
+        Args:
+            limit: Maximum number of prices to read (all if not provided)
+            
         Returns:
             List of property prices as strings
         """
         try:
-            self.wait_for_results_to_load()
-            price_elements = self.find_elements(self.PROPERTY_PRICES, timeout=10)
-            prices = [element.text for element in price_elements if element.text]
+            _, prices = self._fast_scrape()
+            if prices:
+                prices = prices[:limit]
+            else:
+                self.wait_for_results_to_load()
+                prices = self.get_all_texts(self.PROPERTY_PRICES, limit)
             logger.info(f"Retrieved {len(prices)} property prices")
             return prices
-        except Exception as e:
+        except LOOKUP_ERRORS as e:
             logger.error(f"Failed to get property prices: {e}")
             return []
     
@@ -270,6 +384,6 @@ class SearchResultsPage(BasePage):
             # Check if we have results
             count = self.get_search_results_count()
             return count > 0
-        except Exception as e:
+        except LOOKUP_ERRORS as e:
             logger.error(f"Failed to verify filters: {e}")
             return False
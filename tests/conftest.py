@@ -3,18 +3,23 @@ Pytest configuration and fixtures.
 Contains setup, teardown, and common fixtures for all tests.
 """
 
+import os
+import time
 import pytest
-import allure
 from datetime import datetime
-from selenium.webdriver import Remote
-from utils.driver_factory import DriverFactory
+from urllib.parse import urljoin
+from utils import allure_fast
+from utils.driver_pool import DriverPool
 from utils.logger import Logger, get_logger
-from utils.helpers import FileHelper
+from utils.helpers import FileHelper, ReportHelper
 from config.config import Config
 from pages.home_page import HomePage
 
 logger = get_logger(__name__)
 
+# Start of this process's test session, used to detect files written by this run
+SESSION_START = time.time()
+
 
 def pytest_addoption(parser):
     """Add custom command line options."""
@@ -30,12 +35,25 @@ def pytest_addoption(parser):
         default="false",
         help="Run browser in headless mode: true or false"
     )
+    parser.addoption(
+        "--page-load-strategy",
+        action="store",
+        default=None,
+        choices=("normal", "eager", "none"),
+        help="WebDriver page load strategy (default: PAGE_LOAD_STRATEGY env or eager)"
+    )
+    parser.addoption(
+        "--block-resources",
+        action="store_true",
+        default=False,
+        help="Block images, fonts and trackers in Chromium browsers"
+    )
 
 
-@pytest.fixture(scope="function")
+@pytest.fixture(scope="session")
 def driver(request):
     """
-    WebDriver fixture with setup and teardown.
+    Session-wide WebDriver fixture shared by all tests.
     
     Args:
         request: Pytest request object
@@ -49,50 +67,113 @@ def driver(request):
     
     # Create driver
     logger.info(f"Setting up driver: {browser} (headless: {headless})")
-    driver_instance = DriverFactory.create_driver(browser=browser, headless=headless)
+    driver_instance = DriverPool.acquire(browser=browser, headless=headless)
+    
+    yield driver_instance
+    
+    # Teardown
+    logger.info("Tearing down driver")
+    DriverPool.release(driver_instance)
+
+
+@pytest.fixture(scope="session", autouse=True)
+def prewarm_connection(driver):
+    """
+    Open a connection to the site once per worker before the first test.
+    
+    The browser keeps the resolved host and TLS connection for later navigations.
+    
+    Args:
+        driver: Session WebDriver instance
+    """
+    try:
+        driver.get(urljoin(Config.BASE_URL, "/robots.txt"))
+    except Exception as e:
+        logger.warning(f"Connection pre-warm failed: {e}")
+
+
+def reset_browser_state(driver):
+    """
+    Reset the browser to a clean state; cookie consent must be given again afterwards.
+    
+    Args:
+        driver: WebDriver instance
+    """
+    DriverPool.reset(driver)
+    HomePage.reset_cookie_cache(driver)
+
+
+@pytest.fixture(scope="class")
+def class_driver(driver):
+    """
+    Session driver with browser state reset, for class-scoped setup shared by a test class.
+    
+    Args:
+        driver: Session WebDriver instance
+        
+    Returns:
+        WebDriver instance
+    """
+    reset_browser_state(driver)
+    return driver
+
+
+@pytest.fixture(scope="function")
+def fresh_driver(driver, request):
+    """
+    Per-test view of the session driver with browser state reset.
+    
+    Args:
+        driver: Session WebDriver instance
+        request: Pytest request object
+        
+    Yields:
+        WebDriver instance
+    """
+    # Start every test from a clean browser state
+    reset_browser_state(driver)
     
     # Log test start
     test_name = request.node.name
     Logger.log_test_start(test_name)
+    ReportHelper.start_batch()
     
-    yield driver_instance
+    yield driver
     
-    # Teardown
-    logger.info("Tearing down driver")
+    # Emit page object attachments as one JSON attachment
+    ReportHelper.flush_batch(test_name)
     
     # Capture screenshot on failure
-    if request.node.rep_call.failed if hasattr(request.node, 'rep_call') else False:
+    failed = hasattr(request.node, 'rep_call') and request.node.rep_call.failed
+    if failed:
         try:
-            screenshot_path = FileHelper.save_screenshot(driver_instance, test_name)
+            screenshot_path = FileHelper.save_screenshot(driver, test_name)
             if screenshot_path:
-                allure.attach.file(
+                allure_fast.attach_file(
                     str(screenshot_path),
                     name=f"failure_{test_name}",
-                    attachment_type=allure.attachment_type.PNG
+                    attachment_type=allure_fast.attachment_type.PNG
                 )
         except Exception as e:
             logger.error(f"Failed to capture screenshot: {e}")
     
     # Log test end
-    status = "PASSED" if not (hasattr(request.node, 'rep_call') and request.node.rep_call.failed) else "FAILED"
+    status = "FAILED" if failed else "PASSED"
     Logger.log_test_end(test_name, status)
-    
-    # Quit driver
-    DriverFactory.quit_driver(driver_instance)
 
 
 @pytest.fixture(scope="function")
-def home_page(driver):
+def home_page(fresh_driver):
     """
     HomePage fixture.
     
     Args:
-        driver: WebDriver instance
+        fresh_driver: WebDriver instance with reset browser state
         
     Returns:
         HomePage instance
     """
-    page = HomePage(driver)
+    page = HomePage(fresh_driver)
     page.open()
     return page
 
@@ -111,9 +192,27 @@ def pytest_runtest_makereport(item, call):
     setattr(item, f"rep_{rep.when}", rep)
 
 
+def get_worker_id(config) -> str:
+    """
+    Get the pytest-xdist worker id.
+    
+    Args:
+        config: Pytest config object
+        
+    Returns:
+        Worker id (e.g. gw0) or "master" when not running under xdist
+    """
+    workerinput = getattr(config, "workerinput", None)
+    return workerinput.get("workerid", "master") if workerinput else "master"
+
+
 @pytest.fixture(scope="session", autouse=True)
-def configure_allure_environment():
+def configure_allure_environment(request):
     """Configure Allure environment properties."""
+    # Only one process writes the file to avoid races between xdist workers
+    if get_worker_id(request.config) not in ("master", "gw0"):
+        return
+    
     try:
         import platform
         from selenium import __version__ as selenium_version
@@ -128,13 +227,18 @@ def configure_allure_environment():
         }
         
         # Write environment properties for Allure
-        allure_results_dir = Config.REPORTS_DIR / "allure-results"
-        allure_results_dir.mkdir(exist_ok=True)
+        allure_results_dir = Config.ensure_dir(Config.REPORTS_DIR / "allure-results")
         
         env_file = allure_results_dir / "environment.properties"
-        with open(env_file, 'w') as f:
+        if env_file.exists() and env_file.stat().st_mtime > SESSION_START:
+            return  # Already written during this run
+        
+        # Write to a temp file and swap it in so readers never see a partial file
+        tmp_file = env_file.with_name(f"{env_file.name}.tmp.{os.getpid()}")
+        with open(tmp_file, 'w') as f:
             for key, value in environment_properties.items():
                 f.write(f"{key}={value}\n")
+        os.replace(tmp_file, env_file)
         
         logger.info("Allure environment configured")
     except Exception as e:
@@ -148,6 +252,19 @@ def pytest_configure(config):
     Args:
         config: Pytest config object
     """
+    # Test steps and attachments are only worth recording when a report is written
+    allure_fast.configure(
+        bool(getattr(config.option, "allure_report_dir", None))
+        and Config.ALLURE_STEPS
+    )
+    
+    # Apply the page load strategy before any driver is created
+    page_load_strategy = config.getoption("--page-load-strategy")
+    if page_load_strategy:
+        Config.PAGE_LOAD_STRATEGY = page_load_strategy
+    if config.getoption("--block-resources"):
+        Config.BLOCK_RESOURCES = True
+    
     # Register custom markers
     config.addinivalue_line("markers", "smoke: Quick smoke tests")
     config.addinivalue_line("markers", "regression: Full regression tests")
@@ -158,10 +275,10 @@ def pytest_configure(config):
 
 
 @pytest.fixture(scope="session", autouse=True)
-def test_session_setup():
+def test_session_setup(request):
     """Session-level setup."""
     logger.info("=" * 80)
-    logger.info("TEST SESSION STARTED")
+    logger.info(f"TEST SESSION STARTED (worker: {get_worker_id(request.config)})")
     logger.info(f"Timestamp: {datetime.now().strftime('%Y-%m-%d %H:%M:%S')}")
     logger.info(f"Browser: {Config.BROWSER}")
     logger.info(f"Base URL: {Config.BASE_URL}")
@@ -169,6 +286,8 @@ def test_session_setup():
     
     yield
     
+    DriverPool.close_all()
+    
     logger.info("=" * 80)
     logger.info("TEST SESSION COMPLETED")
     logger.info("=" * 80)
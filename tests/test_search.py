@@ -4,137 +4,80 @@ Tests for Booking.com search features.
 """
 
 import pytest
-import allure
+from utils import allure_fast as allure
 from pages.home_page import HomePage
-from pages.search_results_page import SearchResultsPage
 from utils.helpers import DateHelper, DataHelper
 from utils.logger import get_logger
 
 logger = get_logger(__name__)
 
+# Destination searches with optional dates (days from now) and guests
+SEARCH_SCENARIOS = [
+    pytest.param({"destination": "London"}, id="london", marks=pytest.mark.smoke),
+    pytest.param({"destination": "Paris", "check_in": 30, "check_out": 33}, id="paris-dates", marks=pytest.mark.smoke),
+    pytest.param({"destination": "Dubai", "adults": 4, "children": 2, "rooms": 2}, id="dubai-guests"),
+    pytest.param({"destination": "New York", "check_names": True}, id="ny-names", marks=pytest.mark.smoke),
+]
+
 
 @allure.feature("Search")
 @allure.story("Basic Search")
 class TestSearch:
     """Test cases for search functionality."""
     
-    @pytest.mark.smoke
-    @pytest.mark.search
-    @allure.title("Test search with destination only")
-    @allure.description("Verify that user can search for hotels by entering only destination")
-    @allure.severity(allure.severity_level.CRITICAL)
-    def test_search_with_destination(self, home_page):
-        """Test basic search with destination only."""
-        with allure.step("Enter destination"):
-            destination = "London"
-            home_page.enter_destination(destination)
-        
-        with allure.step("Click search button"):
-            home_page.click_search()
-        
-        with allure.step("Verify search results are displayed"):
-            search_results = SearchResultsPage(home_page.driver)
-            assert search_results.is_loaded(), "Search results page did not load"
-            
-            results_count = search_results.get_search_results_count()
-            assert results_count > 0, "No search results found"
-            
-            logger.info(f"Test passed: Found {results_count} results for {destination}")
-    
-    @pytest.mark.smoke
     @pytest.mark.search
-    @allure.title("Test search with destination and dates")
-    @allure.description("Verify that user can search for hotels with destination and date range")
+    @pytest.mark.parametrize("scenario", SEARCH_SCENARIOS)
+    @allure.title("Test search with destination, dates and guests")
+    @allure.description("Verify that user can search for hotels by destination, optionally with dates and guests")
     @allure.severity(allure.severity_level.CRITICAL)
-    def test_search_with_dates(self, home_page):
-        """Test search with destination and dates."""
-        with allure.step("Prepare test data"):
-            destination = "Paris"
-            check_in = DateHelper.get_future_date(30)
-            check_out = DateHelper.get_future_date(33)
-            
-            allure.attach(f"Check-in: {check_in}, Check-out: {check_out}", 
-                         name="Test Data", 
-                         attachment_type=allure.attachment_type.TEXT)
+    def test_search(self, home_page, scenario):
+        """Test search with a destination and the optional extras of the scenario."""
+        destination = scenario["destination"]
         
         with allure.step("Enter destination"):
             home_page.enter_destination(destination)
         
-        with allure.step("Select check-in date"):
-            home_page.select_check_in_date(check_in)
-        
-        with allure.step("Select check-out date"):
-            home_page.select_check_out_date(check_out)
+        if "check_in" in scenario:
+            with allure.step("Select dates"):
+                check_in = DateHelper.get_future_date(scenario["check_in"])
+                check_out = DateHelper.get_future_date(scenario["check_out"])
+                allure.attach(f"Check-in: {check_in}, Check-out: {check_out}",
+                              name="Test Data",
+                              attachment_type=allure.attachment_type.TEXT)
+                
+                home_page.select_check_in_date(check_in)
+                home_page.select_check_out_date(check_out)
+        
+        if "adults" in scenario:
+            with allure.step("Configure guests"):
+                home_page.select_guests(
+                    adults=scenario["adults"],
+                    children=scenario.get("children", 0),
+                    rooms=scenario.get("rooms", 1)
+                )
         
         with allure.step("Click search button"):
-            home_page.click_search()
-        
-        with allure.step("Verify search results are displayed"):
-            search_results = SearchResultsPage(home_page.driver)
-            assert search_results.is_loaded(), "Search results page did not load"
+            search_results = home_page.click_search()
+        
+        if scenario.get("check_names"):
+            with allure.step("Verify property names are displayed"):
+                # Only the first few properties are logged, so only read those
+                property_names = search_results.get_all_property_names(limit=3)
+                if not property_names:
+                    pytest.fail("No property names found")
+                
+                for i, name in enumerate(property_names, 1):
+                    logger.info("Property %s: %s", i, name)
+                    allure.attach(name, name=f"Property {i}", attachment_type=allure.attachment_type.TEXT)
             
-            results_count = search_results.get_search_results_count()
-            assert results_count > 0, "No search results found"
-            
-            logger.info(f"Test passed: Found {results_count} results for {destination}")
-    
-    @pytest.mark.search
-    @allure.title("Test search with multiple guests")
-    @allure.description("Verify that user can search for hotels with multiple guests and rooms")
-    @allure.severity(allure.severity_level.NORMAL)
-    def test_search_with_guests(self, home_page):
-        """Test search with multiple guests."""
-        with allure.step("Prepare test data"):
-            destination = "Dubai"
-            adults = 4
-            children = 2
-            rooms = 2
-        
-        with allure.step("Enter destination"):
-            home_page.enter_destination(destination)
-        
-        with allure.step("Configure guests"):
-            home_page.select_guests(adults=adults, children=children, rooms=rooms)
-        
-        with allure.step("Click search button"):
-            home_page.click_search()
-        
-        with allure.step("Verify search results are displayed"):
-            search_results = SearchResultsPage(home_page.driver)
-            assert search_results.is_loaded(), "Search results page did not load"
-            
-            results_count = search_results.get_search_results_count()
-            assert results_count > 0, "No search results found"
-            
-            logger.info(f"Test passed: Found {results_count} results for {destination}")
-    
-    @pytest.mark.smoke
-    @pytest.mark.search
-    @allure.title("Test search results are displayed")
-    @allure.description("Verify that search results contain property information")
-    @allure.severity(allure.severity_level.CRITICAL)
-    def test_search_results_displayed(self, home_page):
-        """Test that search results display property information."""
-        with allure.step("Perform search"):
-            destination = "New York"
-            home_page.enter_destination(destination)
-            home_page.click_search()
-        
-        with allure.step("Verify search results page loads"):
-            search_results = SearchResultsPage(home_page.driver)
-            assert search_results.is_loaded(), "Search results page did not load"
-        
-        with allure.step("Verify property names are displayed"):
-            property_names = search_results.get_all_property_names()
-            assert len(property_names) > 0, "No property names found"
-            
-            # Log first few properties
-            logger.info(f"Found {len(property_names)} properties")
-            for i, name in enumerate(property_names[:3], 1):
-                logger.info(f"Property {i}: {name}")
-                allure.attach(name, name=f"Property {i}", attachment_type=allure.attachment_type.TEXT)
-        
-        logger.info("Test passed: Search results displayed correctly")
+            logger.info("Test passed: Search results displayed correctly")
+        else:
+            with allure.step("Verify search results are displayed"):
+                results_count = search_results.get_search_results_count()
+                if results_count <= 0:
+                    pytest.fail("No search results found")
+                
+                logger.info("Test passed: Found %s results for %s", results_count, destination)
     
     @pytest.mark.regression
     @pytest.mark.search
@@ -145,7 +88,8 @@ class TestSearch:
         """Test search with complete scenario from test data."""
         with allure.step("Load test data"):
             scenario = DataHelper.get_search_scenario(0)
-            assert scenario, "Failed to load test scenario"
+            if not scenario:
+                pytest.fail("Failed to load test scenario")
             
             destination = scenario.get("destination")
             adults = scenario.get("adults", 2)
@@ -165,7 +109,7 @@ class TestSearch:
             )
         
         with allure.step("Perform complete search"):
-            home_page.search(
+            search_results = home_page.search(
                 destination=destination,
                 check_in_date=check_in,
                 check_out_date=check_out,
@@ -175,10 +119,8 @@ class TestSearch:
             )
         
         with allure.step("Verify search results"):
-            search_results = SearchResultsPage(home_page.driver)
-            assert search_results.is_loaded(), "Search results page did not load"
-            
             results_count = search_results.get_search_results_count()
-            assert results_count > 0, "No search results found"
+            if results_count <= 0:
+                pytest.fail("No search results found")
             
-            logger.info(f"Test passed: Complete search scenario executed successfully")
+            logger.info("Test passed: Complete search scenario executed successfully")
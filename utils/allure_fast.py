@@ -0,0 +1,82 @@
+"""
+Allure fast-path module.
+Drop-in replacement for the allure API used by the tests that skips steps and
+attachments when no Allure report is being written.
+"""
+
+import contextlib
+import allure
+
+# Decorators and constants are cheap and evaluated at import; always use the real ones
+feature = allure.feature
+story = allure.story
+title = allure.title
+description = allure.description
+severity = allure.severity
+severity_level = allure.severity_level
+attachment_type = allure.attachment_type
+
+# Whether steps and attachments are recorded; set by conftest from --alluredir and ALLURE_STEPS
+_enabled = True
+
+
+def configure(enabled: bool):
+    """
+    Enable or disable recording of steps and attachments.
+    
+    Args:
+        enabled: True when an Allure results directory is being written
+    """
+    global _enabled
+    _enabled = enabled
+
+
+def is_enabled() -> bool:
+    """
+    Check whether steps and attachments are recorded.
+    
+    Returns:
+        True if recording is enabled
+    """
+    return _enabled
+
+
+def step(step_title: str):
+    """
+    Allure step context manager, or a no-op one when reporting is disabled.
+    
+    Args:
+        step_title: Step title
+        
+    Returns:
+        Context manager
+    """
+    return allure.step(step_title) if _enabled else contextlib.nullcontext()
+
+
+def attach(body, name: str = None, attachment_type=None, extension: str = None):
+    """
+    Attach content to the Allure report when reporting is enabled.
+    
+    Args:
+        body: Attachment content
+        name: Attachment name
+        attachment_type: Allure attachment type
+        extension: File extension
+    """
+    if _enabled:
+        allure.attach(body, name=name, attachment_type=attachment_type, extension=extension)
+
+
+def attach_file(source, name: str = None, attachment_type=None, extension: str = None):
+    """
+    Attach a file to the Allure report when reporting is enabled.
+    
+    Args:
+        source: Path of the file to attach
+        name: Attachment name
+        attachment_type: Allure attachment type
+        extension: File extension
+    """
+    if _enabled:
+        allure.attach.file(source, name=name, attachment_type=attachment_type, extension=extension)
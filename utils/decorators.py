@@ -3,35 +3,70 @@ Custom decorators module.
 Provides decorators for logging, error handling, and retry logic.
 """
 
+import atexit
 import functools
+import logging
+import random
 import time
-import allure
+from concurrent.futures import ThreadPoolExecutor
+from config.config import Config
+from utils import allure_fast
 from utils.logger import get_logger
 
 logger = get_logger(__name__)
 
+# Writes failure screenshots to disk off the failing test's path; drained at exit
+_screenshot_executor = ThreadPoolExecutor(max_workers=1, thread_name_prefix="screenshot")
+atexit.register(_screenshot_executor.shutdown, wait=True)
+
+
+def _write_screenshot(path, png: bytes):
+    """
+    Write screenshot bytes to disk.
+    
+    Args:
+        path: Destination path
+        png: PNG image data
+    """
+    try:
+        with open(path, 'wb') as f:
+            f.write(png)
+        logger.info(f"Screenshot saved: {path}")
+    except OSError as e:
+        logger.error(f"Failed to save screenshot: {e}")
+
 
 def log_action(func):
     """
     Decorator to log method entry and exit.
     
+    The logging level is checked once, at decoration time: when INFO is disabled (e.g. LOG_LEVEL=WARNING)
+    the function is returned undecorated and its errors surface through the normal test failure report.
+    
     Args:
         func: Function to decorate
         
     Returns:
-        Wrapped function
+        Wrapped function, or func itself when INFO logging is disabled
     """
+    if not logger.isEnabledFor(logging.INFO):
+        return func
+    
+    func_name = func.__name__
+    # Bound once so each call skips the method lookups
+    info = logger.info
+    error = logger.error
+    
     @functools.wraps(func)
     def wrapper(*args, **kwargs):
-        func_name = func.__name__
-        logger.info(f"Executing: {func_name}")
+        info("Executing: %s", func_name)
         
         try:
             result = func(*args, **kwargs)
-            logger.info(f"Completed: {func_name}")
+            info("Completed: %s", func_name)
             return result
         except Exception as e:
-            logger.error(f"Error in {func_name}: {str(e)}")
+            error(f"Error in {func_name}: {str(e)}")
             raise
     
     return wrapper
@@ -52,20 +87,20 @@ def screenshot_on_failure(func):
         try:
             return func(self, *args, **kwargs)
         except Exception as e:
-            # Assume self has driver attribute
-            if hasattr(self, 'driver'):
+            # Page objects keep their WebDriver in self.driver
+            driver = getattr(self, 'driver', None)
+            if driver is not None:
                 try:
-                    from utils.helpers import FileHelper
-                    screenshot_path = FileHelper.save_screenshot(
-                        self.driver, 
-                        func.__name__
+                    # Grab the image now, while the page still shows the failure, and save it in the background
+                    png = driver.get_screenshot_as_png()
+                    allure_fast.attach(
+                        png,
+                        name=f"failure_{func.__name__}",
+                        attachment_type=allure_fast.attachment_type.PNG
+                    )
+                    _screenshot_executor.submit(
+                        _write_screenshot, Config.get_screenshot_path(func.__name__), png
                     )
-                    if screenshot_path:
-                        allure.attach.file(
-                            str(screenshot_path),
-                            name=f"failure_{func.__name__}",
-                            attachment_type=allure.attachment_type.PNG
-                        )
                 except Exception as screenshot_error:
                     logger.error(f"Failed to capture screenshot: {screenshot_error}")
             raise
@@ -73,14 +108,18 @@ def screenshot_on_failure(func):
     return wrapper
 
 
-def retry(max_attempts: int = 3, delay: float = 1.0, exceptions: tuple = (Exception,)):
+def retry(max_attempts: int = 3, delay: float = 1.0, exceptions: tuple = (Exception,),
+          backoff: float = 2.0, max_delay: float = 30.0, jitter: bool = True):
     """
-    Decorator to retry a function on failure.
+    Decorator to retry a function on failure with capped exponential backoff.
     
     Args:
         max_attempts: Maximum number of retry attempts
-        delay: Delay between retries in seconds
+        delay: Delay before the first retry in seconds
         exceptions: Tuple of exceptions to catch
+        backoff: Multiplier applied to the delay after each retry
+        max_delay: Upper bound for a single delay in seconds
+        jitter: Randomize each delay between 50% and 150% so parallel workers don't retry in lockstep
         
     Returns:
         Decorator function
@@ -99,11 +138,14 @@ def retry(max_attempts: int = 3, delay: float = 1.0, exceptions: tuple = (Except
                             f"{func.__name__} failed after {max_attempts} attempts: {str(e)}"
                         )
                         raise
+                    wait = min(max_delay, delay * backoff ** (attempts - 1))
+                    if jitter:
+                        wait *= random.uniform(0.5, 1.5)
                     logger.warning(
                         f"{func.__name__} failed (attempt {attempts}/{max_attempts}), "
-                        f"retrying in {delay}s: {str(e)}"
+                        f"retrying in {wait:.2f}s: {str(e)}"
                     )
-                    time.sleep(delay)
+                    time.sleep(wait)
         
         return wrapper
     
@@ -121,10 +163,12 @@ def allure_step(step_title: str = None):
         Decorator function
     """
     def decorator(func):
+        # Resolved once per decorated function rather than on every call
+        title = step_title or func.__name__.replace('_', ' ').title()
+        
         @functools.wraps(func)
         def wrapper(*args, **kwargs):
-            title = step_title or func.__name__.replace('_', ' ').title()
-            with allure.step(title):
+            with allure_fast.step(title):
                 return func(*args, **kwargs)
         
         return wrapper
@@ -142,13 +186,17 @@ def measure_time(func):
     Returns:
         Wrapped function
     """
+    func_name = func.__name__
+    info = logger.info
+    perf_counter = time.perf_counter
+    
     @functools.wraps(func)
     def wrapper(*args, **kwargs):
-        start_time = time.time()
+        start_time = perf_counter()
         result = func(*args, **kwargs)
-        end_time = time.time()
+        end_time = perf_counter()
         execution_time = end_time - start_time
-        logger.info(f"{func.__name__} executed in {execution_time:.2f} seconds")
+        info("%s executed in %.2f seconds", func_name, execution_time)
         return result
     
     return wrapper
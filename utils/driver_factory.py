@@ -3,22 +3,33 @@ WebDriver factory module.
 Manages WebDriver creation and configuration for different browsers.
 """
 
+import os
+import shutil
+import socket
 from selenium import webdriver
-from selenium.webdriver.chrome.service import Service as ChromeService
-from selenium.webdriver.firefox.service import Service as FirefoxService
-from selenium.webdriver.edge.service import Service as EdgeService
-from webdriver_manager.chrome import ChromeDriverManager
-from webdriver_manager.firefox import GeckoDriverManager
-from webdriver_manager.microsoft import EdgeChromiumDriverManager
+from selenium.common.exceptions import WebDriverException
 from config.config import Config
 from utils.logger import get_logger
 
 logger = get_logger(__name__)
 
+# Chromium experimental options shared by every driver creation
+_EXCLUDE_SWITCHES = ["enable-logging"]
+_CHROME_PREFS = {
+    "profile.default_content_setting_values.notifications": 2,
+    "profile.default_content_settings.popups": 0,
+}
+
 
 class DriverFactory:
     """Factory class for creating WebDriver instances."""
     
+    # Number of local Chrome drivers created in this process, used to pick a free profile
+    _chrome_profiles_used = 0
+    
+    # Fallback profiles created because another run held the worker's profile, by id(driver)
+    _temp_profiles = {}
+    
     @staticmethod
     def create_driver(browser: str = None, headless: bool = None):
         """
@@ -58,20 +69,36 @@ class DriverFactory:
     def _create_chrome_driver(headless: bool):
         """Create Chrome driver using Selenium Manager (Selenium 4.6+)."""
         options = webdriver.ChromeOptions()
+        options.page_load_strategy = Config.PAGE_LOAD_STRATEGY
         
         # Add options
-        for option in Config.get_browser_options("chrome"):
-            options.add_argument(option)
+        options.arguments.extend(Config.get_browser_options_view("chrome"))
         
         if headless:
             options.add_argument("--headless=new")
         
         # Additional Chrome-specific options
-        options.add_experimental_option("excludeSwitches", ["enable-logging"])
-        options.add_experimental_option("prefs", {
-            "profile.default_content_setting_values.notifications": 2,
-            "profile.default_content_settings.popups": 0,
-        })
+        options.add_experimental_option("excludeSwitches", _EXCLUDE_SWITCHES)
+        options.add_experimental_option("prefs", _CHROME_PREFS)
+        
+        if Config.REMOTE_URL:
+            return DriverFactory._create_remote_driver(options)
+        
+        # Keep static assets cached on disk between sessions and runs
+        if Config.PERSISTENT_PROFILE:
+            Config.ensure_dir(Config.PROFILE_ROOT)
+            profile_dir = Config.get_profile_dir(DriverFactory._chrome_profiles_used)
+            DriverFactory._chrome_profiles_used += 1
+            # A concurrent run owns this profile; Chrome itself clears locks left by dead processes
+            if DriverFactory._profile_in_use(profile_dir):
+                temp_profile = profile_dir.with_name(f"{profile_dir.name}_{os.getpid()}")
+                logger.warning(f"Profile {profile_dir} is in use, using {temp_profile} for this run")
+                profile_dir = temp_profile
+            else:
+                temp_profile = None
+            options.add_argument(f"--user-data-dir={profile_dir}")
+            options.add_argument(f"--disk-cache-size={Config.DISK_CACHE_SIZE}")
+            logger.info(f"Using persistent Chrome profile: {profile_dir}")
         
         # Use Selenium Manager (built-in to Selenium 4.6+)
         # This automatically downloads and manages the correct driver
@@ -80,24 +107,59 @@ class DriverFactory:
             logger.info("ChromeDriver created successfully using Selenium Manager")
         except Exception as e:
             logger.warning(f"Selenium Manager failed: {e}, trying webdriver-manager")
-            # Fallback to webdriver-manager
+            # Fallback to webdriver-manager, imported only here since it is slow to load
             try:
+                from selenium.webdriver.chrome.service import Service as ChromeService
+                from webdriver_manager.chrome import ChromeDriverManager
                 service = ChromeService(ChromeDriverManager().install())
                 driver = webdriver.Chrome(service=service, options=options)
             except Exception as e2:
                 logger.error(f"Both Selenium Manager and webdriver-manager failed: {e2}")
+                if temp_profile:
+                    shutil.rmtree(temp_profile, ignore_errors=True)
                 raise
         
+        if temp_profile:
+            DriverFactory._temp_profiles[id(driver)] = temp_profile
         return driver
     
+    @staticmethod
+    def _profile_in_use(profile_dir) -> bool:
+        """
+        Check whether a live Chrome process on this host holds a profile's lock.
+        
+        Chrome's SingletonLock is a symlink to "<hostname>-<pid>"; a lock whose process
+        is gone is stale and Chrome takes it over itself.
+        
+        Args:
+            profile_dir: Chrome user data directory
+            
+        Returns:
+            True if the lock belongs to a running process on this host
+        """
+        try:
+            target = os.readlink(profile_dir / "SingletonLock")
+        except OSError:
+            return False  # No lock (or not a POSIX lock); let Chrome decide
+        host, _, pid = target.rpartition("-")
+        if host != socket.gethostname() or not pid.isdigit():
+            return False
+        try:
+            os.kill(int(pid), 0)
+        except ProcessLookupError:
+            return False
+        except PermissionError:
+            return True  # Alive, owned by another user
+        return True
+    
     @staticmethod
     def _create_firefox_driver(headless: bool):
         """Create Firefox driver."""
         options = webdriver.FirefoxOptions()
+        options.page_load_strategy = Config.PAGE_LOAD_STRATEGY
         
         # Add options
-        for option in Config.get_browser_options("firefox"):
-            options.add_argument(option)
+        options.arguments.extend(Config.get_browser_options_view("firefox"))
         
         if headless:
             options.add_argument("--headless")
@@ -106,6 +168,11 @@ class DriverFactory:
         options.set_preference("dom.webnotifications.enabled", False)
         options.set_preference("dom.push.enabled", False)
         
+        if Config.REMOTE_URL:
+            return DriverFactory._create_remote_driver(options)
+        
+        from selenium.webdriver.firefox.service import Service as FirefoxService
+        from webdriver_manager.firefox import GeckoDriverManager
         service = FirefoxService(GeckoDriverManager().install())
         driver = webdriver.Firefox(service=service, options=options)
         
@@ -115,22 +182,38 @@ class DriverFactory:
     def _create_edge_driver(headless: bool):
         """Create Edge driver."""
         options = webdriver.EdgeOptions()
+        options.page_load_strategy = Config.PAGE_LOAD_STRATEGY
         
         # Add options
-        for option in Config.get_browser_options("edge"):
-            options.add_argument(option)
+        options.arguments.extend(Config.get_browser_options_view("edge"))
         
         if headless:
             options.add_argument("--headless=new")
         
         # Additional Edge-specific options
-        options.add_experimental_option("excludeSwitches", ["enable-logging"])
+        options.add_experimental_option("excludeSwitches", _EXCLUDE_SWITCHES)
+        
+        if Config.REMOTE_URL:
+            return DriverFactory._create_remote_driver(options)
         
+        from selenium.webdriver.edge.service import Service as EdgeService
+        from webdriver_manager.microsoft import EdgeChromiumDriverManager
         service = EdgeService(EdgeChromiumDriverManager().install())
         driver = webdriver.Edge(service=service, options=options)
         
         return driver
     
+    @staticmethod
+    def _create_remote_driver(options):
+        """
+        Create a driver on the shared Selenium server at Config.REMOTE_URL.
+        
+        Args:
+            options: Browser options
+        """
+        logger.info(f"Connecting to remote WebDriver at {Config.REMOTE_URL}")
+        return webdriver.Remote(command_executor=Config.REMOTE_URL, options=options)
+    
     @staticmethod
     def _configure_driver(driver):
         """
@@ -142,6 +225,7 @@ class DriverFactory:
         # Set timeouts
         driver.implicitly_wait(Config.IMPLICIT_WAIT)
         driver.set_page_load_timeout(Config.PAGE_LOAD_TIMEOUT)
+        driver.set_script_timeout(Config.SCRIPT_TIMEOUT)
         
         # Set window size
         if Config.MAXIMIZE_WINDOW:
@@ -149,8 +233,36 @@ class DriverFactory:
         else:
             driver.set_window_size(Config.WINDOW_WIDTH, Config.WINDOW_HEIGHT)
         
+        if Config.BLOCK_RESOURCES:
+            DriverFactory.block_resources(driver)
+        
         logger.info("Driver configured with timeouts and window settings")
     
+    @staticmethod
+    def block_resources(driver) -> bool:
+        """
+        Block Config.BLOCKED_URL_PATTERNS in the current tab through CDP.
+        
+        Chrome applies the block list per tab, so call this again after switching to a new one.
+        
+        Args:
+            driver: WebDriver instance
+            
+        Returns:
+            True if the block list was applied, False if the driver has no CDP access
+        """
+        if not hasattr(driver, "execute_cdp_cmd"):
+            logger.warning("Resource blocking needs a local Chromium driver; skipping")
+            return False
+        try:
+            driver.execute_cdp_cmd("Network.enable", {})
+            driver.execute_cdp_cmd("Network.setBlockedURLs", {"urls": list(Config.BLOCKED_URL_PATTERNS)})
+            logger.info("Blocking images, fonts and trackers")
+            return True
+        except WebDriverException as e:
+            logger.warning(f"Could not block resources: {e}")
+            return False
+    
     @staticmethod
     def quit_driver(driver):
         """
@@ -165,3 +277,8 @@ class DriverFactory:
                 logger.info("Driver quit successfully")
         except Exception as e:
             logger.error(f"Error quitting driver: {e}")
+        finally:
+            # Fallback profiles are per run; only the worker's own profile is kept
+            temp_profile = DriverFactory._temp_profiles.pop(id(driver), None)
+            if temp_profile:
+                shutil.rmtree(temp_profile, ignore_errors=True)
@@ -0,0 +1,118 @@
+"""
+WebDriver pool module.
+Keeps warm WebDriver instances around so tests can reuse browser processes.
+"""
+
+import threading
+from selenium.common.exceptions import WebDriverException
+from config.config import Config
+from utils.driver_factory import DriverFactory
+from utils.logger import get_logger
+
+logger = get_logger(__name__)
+
+
+class DriverPool:
+    """Pool of reusable WebDriver instances keyed by (browser, headless)."""
+    
+    _idle = {}
+    _keys = {}
+    _lock = threading.Lock()
+    
+    @classmethod
+    def acquire(cls, browser: str = None, headless: bool = None):
+        """
+        Check out a driver, reusing an idle one when available.
+        
+        Args:
+            browser: Browser name (chrome, firefox, edge). Uses Config.BROWSER if not provided.
+            headless: Run in headless mode. Uses Config.HEADLESS if not provided.
+            
+        Returns:
+            WebDriver instance
+        """
+        browser = (browser or Config.BROWSER).lower()
+        headless = headless if headless is not None else Config.HEADLESS
+        key = (browser, headless)
+        
+        while True:
+            with cls._lock:
+                idle = cls._idle.get(key)
+                driver = idle.pop() if idle else None
+            if driver is None:
+                break
+            try:
+                cls.reset(driver)
+                logger.info(f"Reusing pooled {browser} driver")
+                return driver
+            except Exception as e:
+                logger.warning(f"Discarding broken pooled driver: {e}")
+                cls._forget(driver)
+                DriverFactory.quit_driver(driver)
+        
+        driver = DriverFactory.create_driver(browser=browser, headless=headless)
+        with cls._lock:
+            cls._keys[id(driver)] = key
+        return driver
+    
+    @classmethod
+    def release(cls, driver):
+        """
+        Return a driver to the pool, quitting it if the pool is full.
+        
+        Args:
+            driver: WebDriver instance obtained from acquire()
+        """
+        if driver is None:
+            return
+        
+        with cls._lock:
+            key = cls._keys.get(id(driver))
+            idle = cls._idle.setdefault(key, []) if key is not None else None
+            pooled = idle is not None and len(idle) < Config.DRIVER_POOL_SIZE
+            if pooled:
+                idle.append(driver)
+        
+        if not pooled:
+            cls._forget(driver)
+            DriverFactory.quit_driver(driver)
+    
+    @classmethod
+    def close_all(cls):
+        """Quit every idle driver in the pool."""
+        with cls._lock:
+            drivers = [driver for idle in cls._idle.values() for driver in idle]
+            cls._idle.clear()
+            cls._keys.clear()
+        
+        for driver in drivers:
+            DriverFactory.quit_driver(driver)
+    
+    @classmethod
+    def _forget(cls, driver):
+        """Stop tracking a driver."""
+        with cls._lock:
+            cls._keys.pop(id(driver), None)
+    
+    @staticmethod
+    def reset(driver):
+        """
+        Reset browser state between tests while keeping the process alive.
+        
+        Args:
+            driver: WebDriver instance
+        """
+        # Close tabs opened by the previous test and go back to the first one
+        handles = driver.window_handles
+        for handle in handles[1:]:
+            driver.switch_to.window(handle)
+            driver.close()
+        driver.switch_to.window(handles[0])
+        
+        # Cookies and storage are scoped to the current origin, so clear them before leaving it
+        try:
+            driver.execute_script("window.localStorage.clear(); window.sessionStorage.clear();")
+        except WebDriverException:
+            pass  # Storage is not accessible on about:blank / data: URLs
+        driver.delete_all_cookies()
+        driver.get("about:blank")
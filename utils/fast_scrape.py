@@ -0,0 +1,55 @@
+"""
+Fast scraping module.
+Reads server-rendered search results over plain HTTP, without driving the browser.
+"""
+
+from typing import List, Tuple
+from utils.logger import get_logger
+
+try:
+    import requests
+    from selectolax.parser import HTMLParser
+    FAST_SCRAPE_AVAILABLE = True
+except ImportError:  # Optional dependencies; callers fall back to Selenium
+    FAST_SCRAPE_AVAILABLE = False
+
+logger = get_logger(__name__)
+
+
+class FastScraper:
+    """Scrapes property names and prices from server-rendered result pages."""
+    
+    TITLE_SELECTOR = "div[data-testid='title']"
+    PRICE_SELECTOR = "span[data-testid='price-and-discounted-price']"
+    REQUEST_TIMEOUT = 10  # seconds
+    
+    @staticmethod
+    def scrape_names_prices(url: str, cookies: list = None, user_agent: str = None) -> Tuple[List[str], List[str]]:
+        """
+        Fetch a results page over HTTP and extract property names and prices.
+        
+        Args:
+            url: Page URL (typically driver.current_url)
+            cookies: Cookies as returned by driver.get_cookies()
+            user_agent: User agent to send (typically the browser's)
+            
+        Returns:
+            Tuple of (names, prices); both empty if the page could not be scraped
+        """
+        if not FAST_SCRAPE_AVAILABLE:
+            return [], []
+        
+        headers = {"User-Agent": user_agent} if user_agent else {}
+        jar = {cookie["name"]: cookie["value"] for cookie in cookies or []}
+        try:
+            response = requests.get(url, headers=headers, cookies=jar, timeout=FastScraper.REQUEST_TIMEOUT)
+            response.raise_for_status()
+        except requests.RequestException as e:
+            logger.warning(f"Fast scrape request failed: {e}")
+            return [], []
+        
+        tree = HTMLParser(response.text)
+        names = [text for text in (node.text(strip=True) for node in tree.css(FastScraper.TITLE_SELECTOR)) if text]
+        prices = [text for text in (node.text(strip=True) for node in tree.css(FastScraper.PRICE_SELECTOR)) if text]
+        logger.info(f"Fast scrape found {len(names)} names and {len(prices)} prices")
+        return names, prices
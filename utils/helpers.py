@@ -4,49 +4,91 @@ Provides common utility functions used across the framework.
 """
 
 import json
+import os
 import random
+import re
 import string
 from datetime import datetime, timedelta
+from functools import lru_cache
 from pathlib import Path
 from typing import Any, Dict, List
 from config.config import Config
+from utils import allure_fast
 from utils.logger import get_logger
 
+try:
+    import orjson
+    _json_loads = orjson.loads
+except ImportError:  # Optional dependency; the stdlib parser gives the same result
+    _json_loads = json.loads
+
 logger = get_logger(__name__)
 
+# Base for relative dates, fixed at import so dates computed during one run never drift past midnight
+_TEST_RUN_START = datetime.now()
+
+# Characters used by StringHelper.generate_random_string
+_ALPHABET = string.ascii_letters + string.digits
+
+# First integer or decimal number in a string
+_NUMBER_RE = re.compile(r'\d+\.?\d*')
+
+
+@lru_cache(maxsize=4)
+def _load_json(path: str, mtime_ns: int) -> Dict[str, Any]:
+    """
+    Parse a JSON file, cached per path and modification time.
+    
+    Args:
+        path: Path to the JSON file
+        mtime_ns: Modification time of the file, so edits invalidate the cache
+        
+    Returns:
+        Parsed JSON data
+    """
+    # Both parsers accept UTF-8 bytes, so skip the text decoding layer
+    with open(path, 'rb') as f:
+        data = _json_loads(f.read())
+    logger.info(f"Test data loaded successfully from {path}")
+    return data
+
 
 class DateHelper:
     """Helper class for date operations."""
     
     @staticmethod
-    def get_future_date(days_from_now: int, date_format: str = "%Y-%m-%d") -> str:
+    @lru_cache(maxsize=128)
+    def get_future_date(days_from_now: int, date_format: str = "%Y-%m-%d", base_date: datetime = None) -> str:
         """
         Get a future date.
         
         Args:
-            days_from_now: Number of days from today
+            days_from_now: Number of days from the base date
             date_format: Date format string
+            base_date: Date to count from (defaults to the start of the test run)
             
         Returns:
             Formatted date string
         """
-        future_date = datetime.now() + timedelta(days=days_from_now)
+        future_date = (base_date or _TEST_RUN_START) + timedelta(days=days_from_now)
         return future_date.strftime(date_format)
     
     @staticmethod
-    def get_date_range(start_days: int, end_days: int) -> tuple:
+    def get_date_range(start_days: int, end_days: int, base_date: datetime = None) -> tuple:
         """
         Get a date range.
         
         Args:
-            start_days: Start date (days from now)
-            end_days: End date (days from now)
+            start_days: Start date (days from the base date)
+            end_days: End date (days from the base date)
+            base_date: Date both ends count from (defaults to the start of the test run)
             
         Returns:
             Tuple of (start_date, end_date) as strings
         """
-        start_date = DateHelper.get_future_date(start_days)
-        end_date = DateHelper.get_future_date(end_days)
+        base_date = base_date or _TEST_RUN_START
+        start_date = DateHelper.get_future_date(start_days, base_date=base_date)
+        end_date = DateHelper.get_future_date(end_days, base_date=base_date)
         return start_date, end_date
     
     @staticmethod
@@ -71,14 +113,14 @@ class DataHelper:
         """
         Load test data from JSON file.
         
+        The file is parsed once and reused until it changes on disk; treat the result as read-only.
+        
         Returns:
             Dictionary containing test data
         """
         try:
-            with open(Config.TEST_DATA_FILE, 'r', encoding='utf-8') as f:
-                data = json.load(f)
-            logger.info(f"Test data loaded successfully from {Config.TEST_DATA_FILE}")
-            return data
+            path = str(Config.TEST_DATA_FILE)
+            return _load_json(path, os.stat(path).st_mtime_ns)
         except Exception as e:
             logger.error(f"Failed to load test data: {e}")
             return {}
@@ -127,7 +169,7 @@ class StringHelper:
         Returns:
             Random string
         """
-        return ''.join(random.choices(string.ascii_letters + string.digits, k=length))
+        return ''.join(random.choices(_ALPHABET, k=length))
     
     @staticmethod
     def clean_text(text: str) -> str:
@@ -140,6 +182,9 @@ class StringHelper:
         Returns:
             Cleaned text
         """
+        # Already clean: the only whitespace is single inner spaces (isprintable rejects tabs, newlines, nbsp, ...)
+        if text.isprintable() and '  ' not in text and text[:1] != ' ' and text[-1:] != ' ':
+            return text
         return ' '.join(text.split())
     
     @staticmethod
@@ -153,9 +198,10 @@ class StringHelper:
         Returns:
             Extracted number or 0.0 if not found
         """
-        import re
-        numbers = re.findall(r'\d+\.?\d*', text)
-        return float(numbers[0]) if numbers else 0.0
+        if not text:
+            return 0.0
+        match = _NUMBER_RE.search(text)
+        return float(match.group()) if match else 0.0
 
 
 class FileHelper:
@@ -204,18 +250,65 @@ class WaitHelper:
         Args:
             condition_func: Function that returns boolean
             timeout: Maximum wait time in seconds
-            poll_frequency: How often to check condition
+            poll_frequency: Longest interval between checks; polling starts at 50ms and backs off to this
             
         Returns:
             True if condition met, False otherwise
         """
         import time
-        end_time = time.time() + timeout
-        while time.time() < end_time:
+        end_time = time.monotonic() + timeout
+        interval = min(0.05, poll_frequency)
+        while True:
             try:
                 if condition_func():
                     return True
             except Exception:
                 pass
-            time.sleep(poll_frequency)
-        return False
+            remaining = end_time - time.monotonic()
+            if remaining <= 0:
+                return False
+            time.sleep(min(interval, remaining))
+            interval = min(poll_frequency, interval * 1.5)
+
+
+class ReportHelper:
+    """Helper class for batching Allure attachments per test."""
+    
+    _batch = None
+    
+    @classmethod
+    def start_batch(cls):
+        """Start collecting attachments for the current test."""
+        cls._batch = {}
+    
+    @classmethod
+    def attach(cls, name: str, value: Any):
+        """
+        Record an attachment, batching it when a test batch is active.
+        
+        Args:
+            name: Attachment name
+            value: Attachment value (must be JSON serializable)
+        """
+        if not allure_fast.is_enabled():
+            return
+        if cls._batch is None:
+            allure_fast.attach(str(value), name=name, attachment_type=allure_fast.attachment_type.TEXT)
+        else:
+            cls._batch.setdefault(name, []).append(value)
+    
+    @classmethod
+    def flush_batch(cls, test_name: str):
+        """
+        Write the collected attachments as a single JSON attachment and stop batching.
+        
+        Args:
+            test_name: Name of the test the attachments belong to
+        """
+        batch, cls._batch = cls._batch, None
+        if batch:
+            allure_fast.attach(
+                json.dumps(batch, indent=2, ensure_ascii=False),
+                name=f"{test_name}_data",
+                attachment_type=allure_fast.attachment_type.JSON
+            )
@@ -3,17 +3,32 @@ Logging configuration module.
 Provides centralized logging functionality for the framework.
 """
 
+import atexit
 import logging
+import queue
 import sys
-from logging.handlers import RotatingFileHandler
+import threading
+from logging.handlers import QueueHandler, QueueListener, RotatingFileHandler
 from pathlib import Path
 from config.config import Config
 
+# Formats are fixed for the process, so every logger shares the same formatter objects
+_CONSOLE_FORMATTER = logging.Formatter(Config.LOG_FORMAT, datefmt=Config.LOG_DATE_FORMAT)
+_FILE_FORMATTER = logging.Formatter(
+    "%(asctime)s - %(name)s - [%(levelname)s] - %(filename)s:%(lineno)d - %(message)s",
+    datefmt=Config.LOG_DATE_FORMAT
+)
+
 
 class Logger:
     """Custom logger class for the framework."""
     
     _loggers = {}
+    _lock = threading.Lock()
+    
+    # Shared handler that hands records to a background thread doing the console and file I/O
+    _queue_handler = None
+    _listener = None
     
     @classmethod
     def get_logger(cls, name: str = __name__) -> logging.Logger:
@@ -26,45 +41,74 @@ class Logger:
         Returns:
             Configured logger instance
         """
-        if name in cls._loggers:
-            return cls._loggers[name]
+        cached = cls._loggers.get(name)
+        if cached is not None:
+            return cached
+        
+        with cls._lock:
+            # Another thread may have configured it while we waited for the lock
+            cached = cls._loggers.get(name)
+            if cached is not None:
+                return cached
+            return cls._create_logger(name)
+    
+    @classmethod
+    def _create_logger(cls, name: str) -> logging.Logger:
+        """
+        Configure a logger that writes through the shared queue handler. Callers must hold cls._lock.
         
+        Args:
+            name: Logger name
+            
+        Returns:
+            Configured logger instance
+        """
         logger = logging.getLogger(name)
         logger.setLevel(getattr(logging, Config.LOG_LEVEL))
         
         # Avoid adding handlers multiple times
         if not logger.handlers:
-            # Console handler
-            console_handler = logging.StreamHandler(sys.stdout)
-            console_handler.setLevel(logging.INFO)
-            console_formatter = logging.Formatter(
-                Config.LOG_FORMAT,
-                datefmt=Config.LOG_DATE_FORMAT
-            )
-            console_handler.setFormatter(console_formatter)
-            
-            # File handler with rotation
-            log_file = Config.get_log_path("automation")
-            file_handler = RotatingFileHandler(
-                log_file,
-                maxBytes=10*1024*1024,  # 10MB
-                backupCount=5,
-                encoding='utf-8'
-            )
-            file_handler.setLevel(logging.DEBUG)
-            file_formatter = logging.Formatter(
-                "%(asctime)s - %(name)s - [%(levelname)s] - %(filename)s:%(lineno)d - %(message)s",
-                datefmt=Config.LOG_DATE_FORMAT
-            )
-            file_handler.setFormatter(file_formatter)
-            
-            # Add handlers
-            logger.addHandler(console_handler)
-            logger.addHandler(file_handler)
+            logger.addHandler(cls._get_queue_handler())
         
         cls._loggers[name] = logger
         return logger
     
+    @classmethod
+    def _get_queue_handler(cls) -> QueueHandler:
+        """
+        Get the shared queue handler, starting its listener on first use. Callers must hold cls._lock.
+        
+        Returns:
+            Queue handler to attach to loggers
+        """
+        if cls._queue_handler is not None:
+            return cls._queue_handler
+        
+        # Console handler
+        console_handler = logging.StreamHandler(sys.stdout)
+        console_handler.setLevel(logging.INFO)
+        console_handler.setFormatter(_CONSOLE_FORMATTER)
+        
+        # File handler with rotation
+        log_file = Config.get_log_path("automation")
+        file_handler = RotatingFileHandler(
+            log_file,
+            maxBytes=10*1024*1024,  # 10MB
+            backupCount=5,
+            encoding='utf-8'
+        )
+        file_handler.setLevel(logging.DEBUG)
+        file_handler.setFormatter(_FILE_FORMATTER)
+        
+        log_queue = queue.Queue(-1)
+        cls._listener = QueueListener(log_queue, console_handler, file_handler, respect_handler_level=True)
+        cls._listener.start()
+        # Flush whatever is still queued before the process exits
+        atexit.register(cls._listener.stop)
+        
+        cls._queue_handler = QueueHandler(log_queue)
+        return cls._queue_handler
+    
     @classmethod
     def log_test_start(cls, test_name: str):
         """